@@ -2,14 +2,14 @@ import json
 import logging
 import os
 import datetime # Added to use datetime.datetime.now()
-from kivy.app import App # Moved here for direct use
+from .environment import GameEnvironment
 # from kivy.clock import Clock # This import appears unused
 
 class AchievementsSystem:
     """Manages tracking and displaying of player achievements."""
     
-    def __init__(self, notify_callback=None):
-        """Initialize the achievements system."""
+    def __init__(self, notify_callback=None, environment=None):
+        """Initialize the achievements system. environment (a GameEnvironment) decides where the achievements file lives."""
         self.notify_callback = notify_callback
         self.achievements = {
             "first_evidence": {"name": "First Clue", "unlocked": False, "icon": "🔍", "description": "Find your first piece of crucial evidence."},
@@ -24,26 +24,11 @@ class AchievementsSystem:
         # Initialize evidence_collection here
         self.evidence_collection = {} 
 
-        # Path setup for achievements file
-        try:
-            # Ensure Kivy App is running before accessing user_data_dir
-            app_instance = App.get_running_app()
-            if app_instance:
-                app_data_dir = app_instance.user_data_dir
-                os.makedirs(app_data_dir, exist_ok=True) # Ensure directory exists
-                self.achievements_file = os.path.join(app_data_dir, "player_achievements.json")
-            else:
-                # Fallback if app is not running (e.g., testing environment)
-                # This path might not be ideal for packaged apps if App isn't running.
-                logging.warning("Kivy App not running during AchievementsSystem init. Using CWD for achievements file.")
-                self.achievements_file = os.path.join(os.getcwd(), "player_achievements.json")
-
-        except Exception as e:
-            # Broader exception catch for issues like `AttributeError` if `App.get_running_app()` is None
-            logging.error(f"Error getting user_data_dir for achievements: {e}. Using CWD as fallback.")
-            self.achievements_file = os.path.join(os.getcwd(), "player_achievements.json")
-            # Ensure the fallback directory exists if it's CWD (though usually it does)
-            # os.makedirs(os.getcwd(), exist_ok=True) # Not strictly necessary for CWD
+        # Path setup for achievements file: the running Kivy app's user_data_dir by default, CWD outside the app
+        environment = environment or GameEnvironment.from_running_app()
+        self.achievements_file = environment.achievements_path
+        try: os.makedirs(os.path.dirname(self.achievements_file), exist_ok=True)
+        except OSError as e: logging.error(f"Error creating directory for achievements file {self.achievements_file}: {e}")
 
         self.load_achievements() # Load existing achievements
         
@@ -0,0 +1,213 @@
+import collections
+from . import game_data
+
+# ==================================
+# Static command grammar
+# ==================================
+VERB_ALIASES = {
+    "go": "move", "get": "take", "look": "examine", "inspect": "examine", "inv": "inventory", "i": "inventory",
+    "bag": "inventory", "q": "quit", "exit": "quit", "restart": "newgame", "again": "newgame",
+    "actions": "list", "commands": "list", "l": "examine", "force": "force", "break": "break",
+    game_data.ACTION_BREAK: game_data.ACTION_BREAK
+}
+
+# Verbs dispatched to GameLogic._command_<name> handlers, and the vocabulary kinds their target is resolved against
+TARGETED_VERBS = {
+    "move": ("exit",),
+    "examine": ("inventory", "item", "furniture", "object"),
+    "take": ("item",),
+    "search": ("furniture",),
+    "use": ("inventory",),
+    "drop": ("inventory",),
+    "unlock": ("exit_room", "furniture"),
+    "force": ("furniture", "exit_room"),
+    game_data.ACTION_BREAK: ("furniture",),
+}
+
+DIRECTION_SHORTHANDS = {"n": ("north",), "s": ("south",), "e": ("east",), "w": ("west",),
+                        "u": ("up", "upstairs"), "d": ("down", "downstairs")}
+
+# target / use_target are canonical names when target_kind / use_target_kind is set (the vocabulary kind they resolved to),
+# otherwise the phrase as typed. For 'use', target is the item (use_item).
+ParsedCommand = collections.namedtuple("ParsedCommand", "verb words target_str target target_kind use_item use_target use_target_kind")
+USE_TARGET_KINDS = ("furniture", "object", "item", "exit_room")
+
+
+class RoomVocabulary:
+    """
+    Lowercased phrase -> canonical entity name, per entity kind, for one room state:
+    exits (with n/s/e/w/u/d shorthands), rooms behind exits, furniture, objects,
+    accessible floor/revealed items and the player's inventory.
+    """
+
+    def __init__(self, room_data, accessible_items, inventory):
+        self.phrases = {"exit": {}, "exit_room": {}, "furniture": {}, "object": {}, "item": {}, "inventory": {}}
+        exits = room_data.get("exits", {}) if room_data else {}
+        for direction, destination in exits.items():
+            self.phrases["exit"].setdefault(direction.lower(), direction)
+            self.phrases["exit_room"].setdefault(destination.lower(), destination)
+        for shorthand, directions in DIRECTION_SHORTHANDS.items():
+            direction = next((d for d in exits if d.lower() in directions), None)
+            if direction: self.phrases["exit"].setdefault(shorthand, direction)
+        for furniture in (room_data.get("furniture", []) if room_data else []):
+            if furniture.get("name"): self.phrases["furniture"].setdefault(furniture["name"].lower(), furniture["name"])
+        for obj in (room_data.get("objects", []) if room_data else []):
+            name = obj.get("name") if isinstance(obj, dict) else obj
+            if name: self.phrases["object"].setdefault(name.lower(), name)
+        for item_name in accessible_items: self.phrases["item"].setdefault(item_name.lower(), item_name)
+        for item_name in inventory: self.phrases["inventory"].setdefault(item_name.lower(), item_name)
+
+    def resolve(self, phrase, kinds):
+        """Canonical name of the first entity of the given kinds called phrase (case-insensitive), or None."""
+        return self.resolve_with_kind(phrase, kinds)[1]
+
+    def resolve_with_kind(self, phrase, kinds):
+        """(kind, canonical name) of the first entity of the given kinds called phrase, or (None, None)."""
+        phrase = phrase.lower()
+        for kind in kinds:
+            name = self.phrases[kind].get(phrase)
+            if name is not None: return kind, name
+        return None, None
+
+
+def parse_command(command_str, vocabulary):
+    """
+    Parses a raw command line in one pass: verb alias lookup, then target resolution against
+    the room vocabulary. Unresolvable targets are passed on as typed (with no kind) so handlers
+    can report them; resolved ones come with their kind, so handlers need no matching of their own.
+    For 'use', a whole phrase naming a carried item wins ('use photo of jason on devil's flight'
+    is one item); otherwise 'use X on Y' splits at the first 'on' whose left side is a carried item.
+    Returns a ParsedCommand, or None for an empty command.
+    """
+    words = command_str.strip().lower().split()
+    if not words: return None
+    verb = VERB_ALIASES.get(words[0], words[0]); target_words = words[1:]; target_str = " ".join(target_words)
+    target = target_kind = use_item = use_target = use_target_kind = None
+    kinds = TARGETED_VERBS.get(verb)
+    if kinds and target_words and vocabulary:
+        if verb == "use":
+            target_kind, use_item = vocabulary.resolve_with_kind(target_str, kinds)
+            if use_item is None:
+                on_indices = [idx for idx, word in enumerate(target_words) if word == "on"]
+                split_at = next((idx for idx in on_indices if vocabulary.resolve(" ".join(target_words[:idx]), kinds)), on_indices[0] if on_indices else None)
+                item_phrase = " ".join(target_words[:split_at]) if split_at is not None else target_str
+                target_kind, use_item = vocabulary.resolve_with_kind(item_phrase, kinds)
+                if use_item is None: use_item = item_phrase
+                if split_at is not None:
+                    target_phrase = " ".join(target_words[split_at + 1:])
+                    use_target_kind, use_target = vocabulary.resolve_with_kind(target_phrase, USE_TARGET_KINDS)
+                    if use_target is None: use_target = target_phrase
+            target = use_item
+        else:
+            target_kind, target = vocabulary.resolve_with_kind(target_str, kinds)
+            if target is None: target = target_str
+    return ParsedCommand(verb, words, target_str, target, target_kind, use_item, use_target, use_target_kind)
+
+
+# ==================================
+# Autocomplete
+# ==================================
+SYSTEM_VERBS = ("inventory", "map", "list", "help", "save", "load", "newgame", "quit") # Handled inline by process_player_input
+COMPLETION_KIND_RANK = {"verb": 0, "alias": 1, "exit": 2, "inventory": 3, "item": 4, "furniture": 5, "object": 6, "exit_room": 7}
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries", "size")
+
+    def __init__(self):
+        self.children = {}
+        self.entries = {}  # kind -> canonical name of the phrase ending at this node
+        self.size = 0      # Entries in this subtree, so emptied branches can be pruned
+
+
+class PrefixTrie:
+    """Character trie of lowercased phrases, each tagged with (kind, canonical name). Supports incremental add/discard."""
+
+    def __init__(self):
+        self.root = _TrieNode()
+
+    def add(self, phrase, kind, name):
+        path = [self.root]
+        for char in phrase:
+            path.append(path[-1].children.setdefault(char, _TrieNode()))
+        if kind in path[-1].entries: path[-1].entries[kind] = name; return
+        path[-1].entries[kind] = name
+        for node in path: node.size += 1
+
+    def discard(self, phrase, kind):
+        path = [self.root]
+        for char in phrase:
+            node = path[-1].children.get(char)
+            if node is None: return
+            path.append(node)
+        if path[-1].entries.pop(kind, None) is None: return
+        for node in path: node.size -= 1
+        for depth in range(len(phrase), 0, -1): # Prune branches left without entries
+            if path[depth].size: break
+            del path[depth - 1].children[phrase[depth - 1]]
+
+    def complete(self, prefix, kinds=None, limit=8):
+        """
+        Phrases starting with prefix (lowercased), as (phrase, kind, name) tuples ranked by
+        kind, then shortest phrase, then alphabetically. kinds optionally restricts the kinds.
+        """
+        node = self.root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None: return []
+        matches = []; stack = [(node, prefix.lower())]
+        while stack:
+            node, phrase = stack.pop()
+            for kind, name in node.entries.items():
+                if kinds is None or kind in kinds: matches.append((phrase, kind, name))
+            stack.extend((child, phrase + char) for char, child in node.children.items())
+        matches.sort(key=lambda m: (COMPLETION_KIND_RANK.get(m[1], len(COMPLETION_KIND_RANK)), len(m[0]), m[0]))
+        return matches[:limit]
+
+
+class CommandCompleter:
+    """
+    Autocomplete for a partially typed command line. Verbs and aliases are indexed once; the
+    room's entities are synced from a RoomVocabulary by diffing it against the previous one,
+    so only the phrases that appeared or disappeared touch the trie.
+    """
+
+    def __init__(self, verbs):
+        self.trie = PrefixTrie()
+        for verb in verbs: self.trie.add(verb, "verb", verb)
+        for alias, verb in VERB_ALIASES.items():
+            if alias not in verbs and len(alias) > 1: self.trie.add(alias, "alias", verb)
+        self.vocabulary = None
+        self.entries = set() # (phrase, kind, name) currently indexed from self.vocabulary
+
+    def sync(self, vocabulary):
+        if vocabulary is self.vocabulary: return
+        entries = set()
+        if vocabulary:
+            for kind, phrases in vocabulary.phrases.items():
+                entries.update((phrase, kind, name) for phrase, name in phrases.items() if phrase not in DIRECTION_SHORTHANDS)
+        for phrase, kind, name in self.entries - entries: self.trie.discard(phrase, kind)
+        for phrase, kind, name in entries - self.entries: self.trie.add(phrase, kind, name)
+        self.vocabulary = vocabulary; self.entries = entries
+
+    def complete(self, text, limit=8):
+        """Full command lines completing text: the verb while it is the only word, otherwise the verb's target."""
+        words = text.lstrip().lower().split(" ")
+        if len(words) == 1:
+            return [phrase for phrase, kind, name in self.trie.complete(words[0], ("verb", "alias"), limit)]
+        verb_word = words[0]; verb = VERB_ALIASES.get(verb_word, verb_word)
+        kinds = TARGETED_VERBS.get(verb)
+        if not kinds: return []
+        target_words = words[1:]
+        head = verb_word
+        if verb == "use" and self.vocabulary: # Past 'on', complete the thing the item is used on
+            on_indices = [idx for idx, word in enumerate(target_words[:-1]) if word == "on"]
+            split_at = next((idx for idx in on_indices if self.vocabulary.resolve(" ".join(target_words[:idx]), kinds)), None)
+            if split_at is not None:
+                head = f"{verb_word} {self.vocabulary.resolve(' '.join(target_words[:split_at]), kinds)} on"
+                target_words = target_words[split_at + 1:]; kinds = USE_TARGET_KINDS
+        seen = set(); completions = []
+        for phrase, kind, name in self.trie.complete(" ".join(target_words), kinds, limit * 2):
+            if name in seen: continue
+            seen.add(name); completions.append(f"{head} {name}")
+        return completions[:limit]
@@ -0,0 +1,43 @@
+import logging
+import os
+import sys
+
+
+class GameEnvironment:
+    """
+    Where a game session keeps its files: user data (saves), logs and the achievements file.
+    GameLogic and AchievementsSystem take one of these instead of asking Kivy, so the engine
+    runs headless (CLI tools, simulation workers) without importing Kivy.
+
+    log_to_file=False leaves logging to whatever handlers the caller configured.
+    """
+
+    def __init__(self, user_data_dir, log_dir=None, achievements_path=None, log_to_file=True):
+        self.user_data_dir = os.path.abspath(user_data_dir)
+        self.log_dir = log_dir or os.path.join(self.user_data_dir, "logs")
+        self.achievements_path = achievements_path or os.path.join(self.user_data_dir, "player_achievements.json")
+        self.log_to_file = log_to_file
+
+    @property
+    def save_dir(self): return os.path.join(self.user_data_dir, "saves")
+
+    def __repr__(self): return f"GameEnvironment({self.user_data_dir!r})"
+
+    @classmethod
+    def from_running_app(cls):
+        """
+        The running Kivy app's user_data_dir, or the working-directory fallbacks used outside the app.
+        Kivy is only consulted when something (the UI) has already imported it.
+        """
+        kivy_app = sys.modules.get("kivy.app")
+        running_app = kivy_app.App.get_running_app() if kivy_app else None
+        if running_app and getattr(running_app, 'user_data_dir', None):
+            return cls(running_app.user_data_dir)
+        fallback_dir = os.path.join(os.getcwd(), "user_data_fallback")
+        logging.warning(f"Kivy app not running or user_data_dir not found. Using fallback: {os.path.abspath(fallback_dir)}")
+        return cls(fallback_dir, log_dir=os.path.join(os.getcwd(), "logs"), achievements_path=os.path.join(os.getcwd(), "player_achievements.json"))
+
+    @classmethod
+    def headless(cls, user_data_dir, log_to_file=False):
+        """Environment for tools and workers: everything under user_data_dir, no log file unless asked for."""
+        return cls(user_data_dir, log_to_file=log_to_file)
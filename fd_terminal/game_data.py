@@ -1,5 +1,4 @@
 # game_data_refactored.py
-import random
 import logging
 import copy
 
@@ -27,8 +26,11 @@ GAS_LEVEL_EXPLOSION_THRESHOLD = 2 #
 QTE_DODGE_WRECKING_BALL_DURATION = 5 #
 GAS_SPREAD_CHANCE_PER_EXIT_PER_TURN = 0.3 #
 GAS_SPREAD_AMOUNT_PER_TICK = 0.2 #
+GAS_SPREAD_DIFFERENCE_THRESHOLD = 0.5 # Gas only spreads into rooms with at least this much less gas
 GAS_DECAY_RATE_PER_TURN = 0.1 #
 GAS_DECAY_CHANCE_PER_TURN = 0.2 #
+INTUITION_HINT_MIN_INTUITION = 3 # Characters with at least this intuition (the Medium) sense hazards in nearby rooms
+INTUITION_HINT_RANGE = 2 # How many moves away such a character senses hazards
 
 # --- NEW: String Literals & Game Identifiers ---
 
@@ -234,10 +236,11 @@ qte_definitions = {
     }
 }
 
+# killed_count is an inclusive (low, high) range, rolled when the intro is generated
 disasters = {
     "a plane whose wing broke off mid-air and": {
         "description": "You were seconds from boarding the flight when {visionary}, their face slick with sweat, seized your arm, their grip like a vice, and rasped, '{warning}' You listen, for some reason, and later watch the plane's wing detach during takeoff, shearing the plane's back half in two. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(50, 180),
+        "killed_count": (50, 180),
         "warnings": [
             "NO! Don't get on! The wing... it's going to SHEAR OFF!",
             "That engine's screaming wrong! It's a death trap, I tell you!",
@@ -252,7 +255,7 @@ disasters = {
     },
     "a devastating highway pile-up on Route 42 that": {
         "description": "You were merging onto Route 42 when a battered pickup truck screeching to a halt directly in front of you. You see {visionary} exit the passenger side, screaming, '{warning}' Just moments later, a cacophony of screeching tires, shattering glass, and twisted metal erupted behind you, a devastating chain reaction of mangled metal and crushed bodies. Cars slammed into each other, crumpling like tin cans, their occupants trapped within. Limbs were twisted at unnatural angles, blood splattered across shattered windshields, and the air filled with the metallic tang of carnage. The screams of the dying echoed through the wreckage. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(20, 50),
+        "killed_count": (20, 50),
         "warnings": [
             "DON'T GO ON THE RAMP! It's a slaughterhouse waiting to happen!",
             "That truck... it's going to jackknife! BRAKE, YOU FOOL!",
@@ -269,7 +272,7 @@ disasters = {
     },
     "a luxury ferry sinking in Lake Serenity that": {
         "description": "You were on deck of the 'Queen Isabella' when {visionary} stumbled towards you, seizing your hand, pleading, '{warning}' Disembarking just minutes before its departure, you stood on the shore as the ferry tragically succumbed to the depths of Lake Serenity. The elegant vessel was swallowed by the dark, churning water, its lights flickering and then extinguished. The screams of the trapped passengers echoed across the still lake before being silenced forever by the cold, unforgiving water. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(80, 250),
+        "killed_count": (80, 250),
         "warnings": [
             "THE HULL IS BREACHED! We're taking on water fast!",
             "TO THE LIFE RAFTS! NOW! Before we're all dragged to the bottom!",
@@ -283,7 +286,7 @@ disasters = {
     },
     "a terrifying rollercoaster derailment at 'Demon's Peak' that": {
         "description": "You stood in the queue for the 'Demon's Peak' coaster when {visionary} suddenly burst through the crowd, yelling, '{warning}' Before you could react, they grabbed your arm, pulling you away. Just as the first car began its ascent, a sickening screech echoed through the park. The coaster lurched violently, its wheels tearing free from the track. The cars twisted and plunged, sending passengers hurtling through the air. Bodies slammed against the twisted metal supports, their screams swallowed by the brutal impact. The air filled with the sickening crunch of bone and the metallic tang of blood. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(15, 40),
+        "killed_count": (15, 40),
         "warnings": [
             "DON'T GET ON THAT RIDE! It's a one-way ticket to oblivion!",
             "THE TRACK IS WARPED! It's going to derail and kill everyone!",
@@ -300,7 +303,7 @@ disasters = {
     },
     "an inferno at the 'Crimson Lounge' nightclub that": {
         "description": "You were about to step into the 'Crimson Lounge' when {visionary} blocked your path, choking out, '{warning}' Moments later, screams erupted from inside as the nightclub became an inferno. Flames licked at the windows, their orange glow reflecting in the panicked eyes of those trapped within. The building became a tomb of charred remains, the air thick with smoke and the stench of burning flesh. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(30, 100),
+        "killed_count": (30, 100),
         "warnings": [
             "FIRE! GET OUT NOW! Don't even hesitate!",
             "THE STAGE IS ENGULFED! The sprinklers aren't working!",
@@ -314,7 +317,7 @@ disasters = {
     },
     "a collapse of the McKinley Memorial Bridge that": {
         "description": "You were driving onto the McKinley Memorial Bridge when {visionary} ran into the road, waving their arms wildly, shrieking, '{warning}' Trusting your gut, you slammed on the brakes and reversed off just as the bridge buckled and plunged into the river below, a horrifying collapse. The concrete groaned and shattered, sending vehicles and bodies plummeting into the churning water, their screams swallowed by the roar of the collapsing structure. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(40, 120),
+        "killed_count": (40, 120),
         "warnings": [
             "DON'T CROSS! THE BRIDGE IS UNSTABLE! IT'S GOING TO COLLAPSE!",
             "THOSE NOISES! The structure is failing! Metal fatigue!",
@@ -331,7 +334,7 @@ disasters = {
     },
     "an explosion at the McKinley Chemical Plant that": {
         "description": "You were walking near the McKinley Chemical Plant when {visionary} grabbed your arm, pulling you away, gasping, '{warning}' Barely out of range, you witnessed the devastating explosion that leveled the facility, a cloud of fire and debris erupting into the sky, sending shockwaves through the city. The air filled with the deafening roar of the explosion and the acrid stench of chemicals and burning metal. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(50, 180),
+        "killed_count": (50, 180),
         "warnings": [
             "EVACUATE! CHEMICAL BREACH! The whole plant is unstable!",
             "TOXIC FUMES! It'll sear your lungs! RUN FOR YOUR LIFE!",
@@ -346,7 +349,7 @@ disasters = {
     # Note: "a wildfire that swept through McKinley National Forest and somehow": was missing from your list but present in game_data.py, so I'll add it here.
     "a wildfire that swept through McKinley National Forest and somehow": {
         "description": "Deep within McKinley National Forest, you paused when {visionary} emerged from the undergrowth, their face etched with worry, rasping, '{warning}' They gestured behind them, where a faint haze of smoke began to curl through the trees. The ground vibrated with the roar of the firestorm, and the sky turned an angry, blood-red as the forest was reduced to a blackened, smoldering wasteland. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(10, 60),
+        "killed_count": (10, 60),
         "warnings": [
             "THE FIRE IS SPREADING TOO FAST! We're cut off!",
             "TO THE RIVER! It's our only chance to survive the inferno!",
@@ -360,7 +363,7 @@ disasters = {
     },
     "a freak storm that flooded downtown McKinley in a matter of minutes and": {
         "description": "You were in downtown McKinley when {visionary} began shouting at the sky, '{warning}'. An inexplicable feeling of unease made you seek higher ground. Minutes later, a freak storm unleashed torrential rain, flooding the streets, turning them into raging rivers that swept away cars and people alike. The air filled with the roar of the storm and the screams of those caught in the flood. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(25, 90),
+        "killed_count": (25, 90),
         "warnings": [
             "GET TO HIGHER GROUND! NOW! Before the streets become rivers!",
             "THE WATER IS RISING TOO QUICKLY! It's a flash flood!",
@@ -374,7 +377,7 @@ disasters = {
     },
     "a high-speed train collision outside McKinley Central Station that": {
         "description": "You were waiting on the platform for the commuter train when {visionary} pushed you back from the edge, screaming, '{warning}' Just then, a freight train collided head-on with your train in a brutal impact, a mangled mess of steel and broken bodies. The air filled with the screech of metal, the shattering of glass, and the screams of the dying. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(60, 200),
+        "killed_count": (60, 200),
         "warnings": [
             "THE SIGNALS ARE DEAD! There's another train on this track!",
             "JUMP! GET OFF THE PLATFORM! NOW!",
@@ -388,7 +391,7 @@ disasters = {
     },
     "a ski lift malfunction that": {
         "description": "You were about to hop on the ski lift when {visionary} freaked out and said, '{warning}' A wave of dizziness washed over you, and you instinctively jumped out of the way just as the lift cable snapped, sending chairs plummeting down the slope. The screams of the falling skiers were lost in the wind, their bodies twisting and tumbling down the mountainside. The ones who held onto their seats were slammed into the mountain below when the cable caught and arced the string of seats through the air. There were {killed_count} people killed when the lift malfunctioned. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(5, 25),
+        "killed_count": (5, 25),
         "warnings": [
             "DON'T GET ON THE LIFT! The cable is about to snap!",
             "THE CABLE IS FRAYING! It's unraveling like a cheap sweater!",
@@ -405,7 +408,7 @@ disasters = {
     },
     "an apartment collapse that": {
         "description": "You were about to enter your apartment building when {visionary} blocked the doorway, saying, '{warning}' A sudden wave of panic hit you, and you backed away rapidly as the entire structure imploded in a cloud of dust and debris, the screams of the trapped residents swallowed by the collapsing building. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(10, 50),
+        "killed_count": (10, 50),
         "warnings": [
             "GET OUT OF THE BUILDING! NOW! The whole thing is coming down!",
             "THE CEILING IS CRACKING! The load-bearing walls are GONE!",
@@ -419,7 +422,7 @@ disasters = {
     },
     "an earthquake in your neighborhood that": {
         "description": "You were walking your garbage out to the street when {visionary} grabbed your hand, yelling, '{warning}' You dove under a sturdy awning just as the earthquake intensified, causing buildings to crumble around you. The air filled with the roar of collapsing structures and the cries of the injured, the ground shaking beneath you. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(25, 30),
+        "killed_count": (25, 30),
         "warnings": [
             "DROP, COVER, AND HOLD ON! PRAY IT'S NOT THE BIG ONE!",
             "GET AWAY FROM WINDOWS! They'll shatter into a million daggers!",
@@ -433,7 +436,7 @@ disasters = {
     },
     "a typhoon off the coast that": {
         "description": "You were near the coast when {visionary} pointed towards the horizon, saying, '{warning}' An inexplicable fear urged you to seek shelter inland, mere hours before a devastating typhoon made landfall, unleashing its fury on the coastline. The wind howled, the waves crashed, and the rain fell in sheets, tearing apart buildings and flooding entire towns. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(150, 600),
+        "killed_count": (150, 600),
         "warnings": [
             "BOARD UP THE WINDOWS! Or the storm will tear them out and us with them!",
             "SEEK SHELTER! Inland! NOW! This isn't just a storm, it's a monster!",
@@ -447,7 +450,7 @@ disasters = {
     },
     "a sinkhole that opened under the McKinley business district and": {
         "description": "You were walking across the street on your lunch break to grab a bite when {visionary} tugged at your shirt, crying, '{warning}' You were in shock at this complete stranger having the audacity to insert themselves into your day, but ran as the ground started to open up in front of you, swallowing the area you were just standing on into a massive sinkhole. The ground collapsed like a gaping maw, the earth crumbling and falling into the darkness below. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(5, 30),
+        "killed_count": (5, 30),
         "warnings": [
             "THE GROUND IS COLLAPSING! It's opening up right under us!",
             "WHAT ARE YOU WAITING FOR?! RUN! Or be swallowed by the earth!",
@@ -459,7 +462,7 @@ disasters = {
     },
     "a cruise ship that sunk after it was hit by a speedboat. The resulting explosion and lack of lifeboats": {
         "description": "You were enjoying the evening festivities on the cruise ship when {visionary} grabbed your arm, yelling, '{warning}' You grab a life jacket and prepare for the worst, just as the boat struck and flames erupted, engulfing a large section of the vessel. The screams of the burning passengers mingled with the crackling of the fire. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(50, 200),
+        "killed_count": (50, 200),
         "warnings": [
             "THAT BOAT IS COMING AT US WAY TOO FAST!!",
             "PUT ON YOUR LIFE JACKET AND JUMP! NOW!!",
@@ -472,7 +475,7 @@ disasters = {
     },
     "a dam break that flooded the nearby Manitou Valley and": {
         "description": "You were picnicking by the river downstream from the massive dam when {visionary} ran towards you, shouting, '{warning}' A primal urge to flee washed over you, and you ran uphill as a wall of water surged towards you, the dam having catastrophically failed. The water roared, a terrifying torrent that swept away everything in its path. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(75, 400),
+        "killed_count": (75, 400),
         "warnings": [
             "HEAD FOR THE HILLS! UPHILL! NOW! Or be swept away!",
             "A WALL OF WATER IS COMING! The dam has burst! RUN!",
@@ -486,7 +489,7 @@ disasters = {
     },
     "a gas pipeline explosion that": {
         "description": "You were driving down a rural road when {visionary} flagged you down, yelling, '{warning}' An overwhelming sense of unease made you accelerate rapidly, narrowly escaping the massive fireball that erupted behind you as a gas pipeline exploded. The shockwave rocked your vehicle, the air filled with the booming roar and the stench of burning gas. Reports indicate there were {killed_count} people who died in the blast. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(10, 40),
+        "killed_count": (10, 40),
         "warnings": [
             "GET AWAY FROM THE PIPELINE! It's about to rupture!",
             "DON'T LIGHT ANYTHING! NOT EVEN A SPARK! Or we're all incinerated!",
@@ -500,7 +503,7 @@ disasters = {
     },
     "a factory collapse that": {
         "description": "You were visiting a local factory when {visionary} rushed towards you, stammering, '{warning}' A sudden wave of claustrophobia made you rush towards the exit, just as the building's roof caved in, crushing everything below in a cascade of twisted metal and concrete, the screams of those trapped within echoing through the collapsing structure. Reports indicate there were {killed_count} people killed in this disaster. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(20, 80),
+        "killed_count": (20, 80),
         "warnings": [
             "THE ROOF IS CAVING IN! The whole structure is failing!",
             "RUN FOR THE EXIT! Don't look back, just run!",
@@ -513,7 +516,7 @@ disasters = {
     },
     "a ferris wheel malfunction that": {
         "description": "The towering Ferris wheel loomed before you. You were about to step into a gondola when {visionary} seized your arm, rasping, '{warning}' They pointed a trembling finger at the central hub. As the wheel began its slow rotation, a sickening grinding sound echoed through the park. Then, with a deafening screech, the central axis snapped. The massive wheel buckled, its gondolas twisting and flinging their occupants into the night air. The cheerful music was replaced by horrifying screams and sickening thuds. Reports indicate there were {killed_count} people killed in this disaster. Afterwards, those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(10, 35),
+        "killed_count": (10, 35),
         "warnings": [
             "STOP THE RIDE! THE AXIS IS SNAPPING! IT'S GOING TO COLLAPSE!",
             "WE'RE GOING TO DIE! Get away from this death machine!",
@@ -530,7 +533,7 @@ disasters = {
     # --- NEW THRILLING DISASTERS ---
     "a shopping mall escalator suddenly reversing at high speed that": {
         "description": "You were idly window shopping, about to step onto the escalator to the food court, when {visionary}, perhaps a mall security guard off-duty, hissed, '{warning}' You hesitated, and a moment later, the ascending escalator grotesquely bucked, then reversed direction at terrifying speed. Screams erupted as shoppers were violently flung downwards, a cascade of bodies tumbling over each other, limbs snapping like twigs against the churning metal steps. The bottom of the escalator became a horrifying meat grinder. Reports indicate {killed_count} people were mangled or killed. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(10, 30),
+        "killed_count": (10, 30),
         "warnings": [
             "DON'T STEP ON IT! THE GEARS ARE SHREDDED!",
             "IT'S GOING TO REVERSE! EVERYONE OFF, NOW!",
@@ -543,7 +546,7 @@ disasters = {
     },
     "a city-wide blackout during a heatwave causing a cascading hospital failure that": {
         "description": "The city sweltered under a record-breaking heatwave. You were visiting a relative in the overburdened McKinley General when {visionary}, a harried-looking nurse, whispered urgently, '{warning}' Suddenly, the lights flickered and died. The city plunged into darkness. Backup generators sputtered and failed under the strain. Life support machines went silent one by one, monitors faded, and the oppressive heat became a suffocating blanket. Panic turned to despair in the corridors. Reports state {killed_count} critical patients perished. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(40, 150),
+        "killed_count": (40, 150),
         "warnings": [
             "THE GRID'S OVERLOADED! IT'S GOING DOWN! ALL OF IT!",
             "GET OUT OF THE HOSPITAL! THE GENERATORS WON'T HOLD!",
@@ -556,7 +559,7 @@ disasters = {
     },
     "a high-rise window washer platform collapsing onto a crowded plaza that": {
         "description": "Lunchtime in the bustling downtown plaza. You were about to sit on a bench when {visionary}, a street artist frantically sketching, yelled, '{warning}' and pointed skyward. High above, a window washing platform swung erratically, then with a sickening series of snaps, its cables gave way. The platform, with its occupants, plummeted dozens of stories, exploding like a bomb on impact with the crowded square. Bodies and debris were flung hundreds of feet. The picturesque scene turned into a bloodbath. {killed_count} were killed instantly. Afterwards, those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(25, 70),
+        "killed_count": (25, 70),
         "warnings": [
             "LOOK UP! THE CABLES ARE SNAPPING! IT'S COMING DOWN!",
             "RUN! GET OUT OF THE PLAZA! IT'S NOT SAFE!",
@@ -569,7 +572,7 @@ disasters = {
     },
     "a grain silo explosion at a rural processing plant that": {
         "description": "You were on a scenic drive through farmland, passing by the towering McKinley Grain Co-op, when {visionary}, an old farmer on a tractor, waved you down frantically, shouting '{warning}' Moments later, a deafening boom ripped through the air. One of the massive silos erupted in a colossal fireball, the shockwave flattening nearby structures and sending a rain of burning grain and twisted metal across the fields. The very air seemed to ignite. Reports indicated {killed_count} workers and bystanders were killed. Later, those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(5, 25),
+        "killed_count": (5, 25),
         "warnings": [
             "THE DUST! IT'S TOO THICK! IT'S GONNA BLOW!",
             "GET AWAY FROM THE SILOS! THEY'RE UNSTABLE!",
@@ -582,7 +585,7 @@ disasters = {
     },
     "a catastrophic theater stage collapse during a live performance that": {
         "description": "You were in the audience, settled in for the premiere of 'McKinley: The Musical!' when {visionary}, perhaps an usher with a look of sheer terror, whispered, '{warning}' Just as the grand finale began, with pyrotechnics and complex hydraulics, the stage rigging above groaned ominously. With a sound like thunder, the entire proscenium arch and tons of equipment collapsed onto the stage, crushing performers and sending the audience into a panicked stampede. The air filled with dust, screams, and the smell of electrical fires. {killed_count} died in the initial collapse or ensuing chaos. Those who initially survived were killed in increasingly bizarre ways, like being {survivor_fates}.",
-        "killed_count": random.randint(30, 90),
+        "killed_count": (30, 90),
         "warnings": [
             "THE RIGGING IS FAILING! THE WHOLE STAGE IS COMING DOWN!",
             "GET OUT! EVACUATE THE THEATER, NOW!",
@@ -3223,6 +3226,62 @@ hazards = {
 
 
 
+# --- Scripted Room Interactions ---
+# Evaluated by GameLogic through interaction_rules.InteractionRuleIndex; see interaction_rules.py for the rule format.
+# Rules of one (verb, target, room) fire in order while their conditions hold, until one with "stop" fires.
+_MRI_PRESENT = {"type": "hazard_active", "hazard_type": HAZARD_TYPE_MRI}
+_CORONERS_KEY_IN_SCAN_ROOM = {"type": "item_at", "item": ITEM_CORONERS_OFFICE_KEY, "room": ROOM_MRI_SCAN_ROOM}
+_MORGUE_CARD_TRIGGERS_MRI = {"type": "target_flag", "flag": "triggers_mri_on_pickup_if_in_mri_room"}
+
+interaction_rules = [
+    # Living Room fireplace: examining it reveals the loose brick, then the cavity behind it once the brick is taken
+    {"verb": ACTION_EXAMINE, "target": "fireplace", "room": ROOM_LIVING_ROOM, "stop": True,
+     "conditions": [{"type": "room_flag", "flag": "loose_brick_taken", "negate": True}, {"type": "item_at", "item": ITEM_LOOSE_BRICK},
+                    {"type": "item_concealed", "item": ITEM_LOOSE_BRICK}],
+     "effects": [{"type": "reveal_item", "item": ITEM_LOOSE_BRICK}, {"type": "message", "text": "One brick looks loose.", "color": "special"}]},
+    {"verb": ACTION_EXAMINE, "target": "fireplace", "room": ROOM_LIVING_ROOM, "stop": True,
+     "conditions": [{"type": "room_flag", "flag": "loose_brick_taken", "negate": True}, {"type": "item_at", "item": ITEM_LOOSE_BRICK}],
+     "effects": [{"type": "message", "text": "Loose brick is still there.", "color": "default"}]},
+    {"verb": ACTION_EXAMINE, "target": "fireplace", "room": ROOM_LIVING_ROOM, "stop": True,
+     "conditions": [{"type": "room_flag", "flag": "loose_brick_taken"}, {"type": "room_flag", "flag": "fireplace_cavity_revealed", "negate": True}],
+     "effects": [{"type": "message", "text": "Where brick was, see dark cavity.", "color": "special"},
+                 {"type": "reveal_container", "furniture": "fireplace cavity"}, {"type": "set_room_flag", "flag": "fireplace_cavity_revealed"}]},
+    {"verb": ACTION_EXAMINE, "target": "fireplace", "room": ROOM_LIVING_ROOM, "stop": True,
+     "conditions": [{"type": "room_flag", "flag": "loose_brick_taken"}, {"type": "room_flag", "flag": "fireplace_cavity_revealed"}],
+     "effects": [{"type": "message", "text": "Cavity still there. Search it?", "color": "default"}]},
+    {"verb": ACTION_TAKE, "target": ITEM_LOOSE_BRICK, "room": ROOM_LIVING_ROOM,
+     "conditions": [], "effects": [{"type": "set_room_flag", "flag": "loose_brick_taken"}]},
+    {"verb": ACTION_TAKE, "target": ITEM_LOOSE_BRICK, "room": ROOM_LIVING_ROOM,
+     "conditions": [{"type": "item_at", "item": ITEM_BASEMENT_KEY}, {"type": "item_hidden", "item": ITEM_BASEMENT_KEY}],
+     "effects": [{"type": "reveal_item", "item": ITEM_BASEMENT_KEY}, {"type": "message", "text": "Pulled brick free, Basement Key clatters out!", "color": "special"}]},
+
+    # MRI Scan Room: picking up the Coroner's Office Key pulls the MRI into its magnetic QTE
+    {"verb": ACTION_TAKE, "target": ITEM_CORONERS_OFFICE_KEY, "room": ROOM_MRI_SCAN_ROOM,
+     "conditions": [], "effects": [{"type": "message", "text": "As you grasp the key, a sudden, intense hum emanates from the MRI machine. A powerful magnetic force flares to life!", "color": "hazard"}]},
+    {"verb": ACTION_TAKE, "target": ITEM_CORONERS_OFFICE_KEY, "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [_MRI_PRESENT], "effects": [{"type": "set_hazard_state", "hazard_type": HAZARD_TYPE_MRI, "state": "coroners_key_qte_initiate_pull"}]},
+    {"verb": ACTION_TAKE, "target": ITEM_CORONERS_OFFICE_KEY, "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [{"type": "hazard_engine_online"}], "effects": [{"type": "message", "text": "The MRI machine remains inert, surprisingly.", "color": "default"}]},
+    {"verb": ACTION_TAKE, "target": ITEM_CORONERS_OFFICE_KEY, "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [], "effects": [{"type": "message", "text": "Hazard system offline, MRI interaction skipped.", "color": "error"}]},
+
+    # MRI Scan Room: the Morgue Key Card wakes the MRI, which rips the Coroner's Office Key out of the equipment cart if it is still there
+    {"verb": ACTION_TAKE, "target": "Morgue Key Card", "room": ROOM_MRI_SCAN_ROOM,
+     "conditions": [_MORGUE_CARD_TRIGGERS_MRI],
+     "effects": [{"type": "message", "text": "Finding the Morgue Key Card here feels ominous. The nearby MRI machine seems to react to its presence, a low thrumming sound starting up...", "color": "warning"}]},
+    {"verb": ACTION_TAKE, "target": "Morgue Key Card", "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [_MORGUE_CARD_TRIGGERS_MRI, _MRI_PRESENT, _CORONERS_KEY_IN_SCAN_ROOM],
+     "effects": [{"type": "message", "text": "The MRI's reaction intensifies, focusing on something else metallic in the room!", "color": "hazard"},
+                 {"type": "magnetize_item", "item": ITEM_CORONERS_OFFICE_KEY, "container": "equipment cart", "hazard_type": HAZARD_TYPE_MRI,
+                  "message": f"The {ITEM_CORONERS_OFFICE_KEY} is ripped from the equipment cart!"},
+                 {"type": "set_hazard_state", "hazard_type": HAZARD_TYPE_MRI, "state": "coroners_key_qte_initiate_pull"}]},
+    {"verb": ACTION_TAKE, "target": "Morgue Key Card", "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [_MORGUE_CARD_TRIGGERS_MRI, _MRI_PRESENT], "effects": [{"type": "set_hazard_state", "hazard_type": HAZARD_TYPE_MRI, "state": "power_surge"}]},
+    {"verb": ACTION_TAKE, "target": "Morgue Key Card", "room": ROOM_MRI_SCAN_ROOM, "stop": True,
+     "conditions": [_MORGUE_CARD_TRIGGERS_MRI, {"type": "hazard_engine_online"}],
+     "effects": [{"type": "message", "text": "The MRI machine remains inert.", "color": "default"}]},
+]
+
 # --- Initial Environmental Conditions for Rooms ---
 
 initial_environmental_conditions = {
@@ -3245,130 +3304,6 @@ status_effects_definitions = {
 }
 
 
-# --- Initial Item Placement Logic (Helper functions, may be moved to GameLogic or a LevelManager later) ---
-# This section is a bit more complex and tightly coupled with global modification.
-# For a refactor, this logic would ideally be managed by GameLogic or a dedicated LevelLoader,
-# operating on level-specific data.
-# For now, these are stubs to indicate where this logic existed.
-# The actual implementation will be in GameLogic which will take filtered data.
-
-def _get_available_container_slots(target_rooms_data, target_items_data):
-    """
-    Helper to get all available 'slots' in containers within specified rooms.
-    A slot is a tuple: (room_name, furniture_name, item_name_if_already_there_or_None).
-    
-    Args:
-        target_rooms_data (dict): Dictionary of room data keyed by room name
-        target_items_data (dict): Dictionary of item data keyed by item name
-        
-    Returns:
-        list: List of tuples representing available container slots
-    """
-    logging.debug("Getting available container slots for placement...")
-    slots = []
-    
-    # Create a mapping of items to their containers and rooms
-    items_by_location = {}
-    for item_name, item_data in target_items_data.items():
-        if "container" in item_data and item_data["container"]:
-            room = item_data.get("location")
-            container = item_data.get("container")
-            if room and container:
-                if (room, container) not in items_by_location:
-                    items_by_location[(room, container)] = []
-                items_by_location[(room, container)].append(item_name)
-    
-    # Process each room and find containers
-    for room_name, room_data in target_rooms_data.items():
-        # Check if the room has furniture
-        if "furniture" in room_data:
-            for furniture in room_data["furniture"]:
-                if furniture.get("container", False):
-                    furniture_name = furniture["name"]
-                    
-                    # Skip locked containers unless specifically needed
-                    if furniture.get("locked", False):
-                        continue
-                    
-                    # Check how many items are already in this container
-                    items_in_container = items_by_location.get((room_name, furniture_name), [])
-                    
-                    # Determine capacity - default to 1 for small containers, more for large ones
-                    capacity = 1
-                    if "large" in furniture_name.lower() or "chest" in furniture_name.lower():
-                        capacity = 3
-                    elif "cabinet" in furniture_name.lower() or "shelf" in furniture_name.lower():
-                        capacity = 2
-                        
-                    # Add empty slots
-                    empty_slots_to_add = capacity - len(items_in_container)
-                    for _ in range(max(0, empty_slots_to_add)):
-                        slots.append((room_name, furniture_name, None))
-                    
-                    # Also include slots with items, as they might be relevant for some operations
-                    for item_name in items_in_container:
-                        slots.append((room_name, furniture_name, item_name))
-    
-    random.shuffle(slots)  # Randomize the order to avoid predictable placements
-    logging.debug(f"Found {len(slots)} total container slots across {len(target_rooms_data)} rooms")
-    return slots
-
-def _place_dynamic_items(item_names_to_place, available_slots, all_items_dict, rooms_dict, item_type_for_log="Item"):
-    """
-    Helper to place a list of items into available container slots.
-    Modifies all_items_dict with location and container.
-    
-    Args:
-        item_names_to_place (list): List of item names to place in containers
-        available_slots (list): List of slots (room_name, furniture_name, item_name_or_None)
-        all_items_dict (dict): Dictionary of all items to modify
-        rooms_dict (dict): Dictionary of rooms data
-        item_type_for_log (str): Type of item for logging purposes
-        
-    Returns:
-        int: Number of items successfully placed
-    """
-    if not item_names_to_place or not available_slots:
-        logging.warning(f"No {item_type_for_log}s to place or no available slots")
-        return 0
-    
-    # Filter to only empty slots
-    empty_slots = [slot for slot in available_slots if slot[2] is None]
-    
-    if not empty_slots:
-        logging.warning(f"No empty slots available for {item_type_for_log} placement")
-        return 0
-        
-    items_to_place = item_names_to_place.copy()
-    random.shuffle(items_to_place)  # Randomize placement order
-    
-    placed_count = 0
-    
-    # Try to place items in available slots
-    for item_name in items_to_place:
-        if not empty_slots:
-            logging.warning(f"Ran out of empty slots while placing {item_type_for_log}s")
-            break
-            
-        # Get the next available slot
-        slot = empty_slots.pop(0)
-        room_name, furniture_name, _ = slot
-        
-        if item_name not in all_items_dict:
-            logging.warning(f"Item '{item_name}' not found in items dictionary")
-            continue
-            
-        # Update the item's location and container
-        all_items_dict[item_name]["location"] = room_name
-        all_items_dict[item_name]["container"] = furniture_name
-        all_items_dict[item_name]["hidden"] = True  # Hidden until container is searched
-        
-        placed_count += 1
-        logging.info(f"Placed {item_type_for_log} '{item_name}' in {furniture_name} in {room_name}")
-            
-    logging.info(f"Successfully placed {placed_count}/{len(item_names_to_place)} {item_type_for_log}s")
-    return placed_count
-
 def get_initial_player_state(character_class="Journalist"):
     """Return a fresh player state dict for the given character class."""
     stats = CHARACTER_CLASSES.get(character_class, CHARACTER_CLASSES["Journalist"])
@@ -1,14 +1,20 @@
 import json 
-import random
 import logging
 import copy
 import os 
 import datetime 
 import collections
-from .utils import color_text 
-from kivy.app import App 
+import itertools
+from collections.abc import Mapping
+from .utils import color_text, freeze_definition
+from .player_state import PlayerState
+from .profiler import profiled_phase
+from .hazard_interactions import compile_hazard_interaction_matrix
 from . import game_data 
 
+# Severity of 'visibility' values; the most severe one set by a room's hazards wins
+VISIBILITY_SEVERITY = {"normal": 0, "dim": 1, "hazy": 1, "dark": 2, "patchy_smoke": 2, "very_dark": 3, "dense_smoke": 3, "zero": 4}
+
 # ==================================
 # Hazard Engine Class
 # ==================================
@@ -25,6 +31,15 @@ class HazardEngine:
         self.room_env = {}                # Stores environmental state per room (e.g., gas level, wetness)
         self.next_hazard_id = 0           # Counter for generating unique hazard instance IDs
         self.temporary_room_effects = [] # To store active temporary effects
+        # Incremental room_env aggregation (see update_environmental_states); rooms are GameLogic.symbols room ids
+        self.env_contributions = {}       # hazard id -> (room id, environmental_effect) currently counted in room_env
+        self.room_env_contributors = {}   # room id -> {hazard id: environmental_effect}
+        self.dirty_env_rooms = set()      # ids of the rooms whose room_env must be re-aggregated
+        # Secondary indexes over active_hazards, kept current by _index_hazard/_unindex_hazard/_move_hazard
+        self.hazards_by_room = {}         # room id -> {hazard id: None}
+        self.hazards_by_type = {}         # hazard type id -> {hazard id: None}
+        self._hazard_order = {}           # hazard id -> sequence number, so index hits come back in active_hazards order
+        self._hazard_sequence = itertools.count()
 
         # Access master hazard definitions from game_data via game_logic_ref
         if self.game_logic and hasattr(self.game_logic, 'game_data') and hasattr(self.game_logic.game_data, 'hazards'):
@@ -32,6 +47,8 @@ class HazardEngine:
         else:
             logging.error("HazardEngine: game_data.hazards not found via game_logic_ref. Hazard definitions will be missing.")
             self.hazards_master_data = {} # Fallback to empty dict
+        # (source type, source state) -> {target type: CompiledHazardInteraction}, see hazard_interactions.py
+        self.interaction_matrix = compile_hazard_interaction_matrix(self.hazards_master_data)
 
         # For tracking IDs processed in a single turn update to avoid cascading issues
         self.processed_hazards_this_turn = set()
@@ -46,9 +63,14 @@ class HazardEngine:
             logging.error("HazardEngine.player: game_logic reference or player object not available!")
             # Return a default player structure to prevent crashes if absolutely necessary,
             # but this indicates a deeper setup problem.
-            return {"location": "Unknown", "inventory": [], "hp": 0, "turns_left": 0, "status_effects": {}}
+            return PlayerState(location="Unknown", inventory=[], hp=0, turns_left=0, status_effects={})
         return self.game_logic.player
 
+    @property
+    def symbols(self):
+        """GameLogic's SymbolTable for the current level; the hazard and environment indexes are keyed by its ids."""
+        return self.game_logic.symbols
+
     @property
     def rooms(self):
         """
@@ -60,11 +82,115 @@ class HazardEngine:
             return {}
         return self.game_logic.current_level_rooms # This is GameLogic's live copy of room data
 
+    @property
+    def rng(self):
+        """The session's hazard random stream (GameLogic.rng.hazards), so hazard rolls replay from the save's seed."""
+        return self.game_logic.rng.hazards
+
+    @property
+    def profiler(self):
+        """GameLogic's TurnProfiler; the engine's turn phases are timed alongside the command pipeline."""
+        return self.game_logic.profiler
+
     def _generate_hazard_id(self):
         """Generates a unique ID for a new hazard instance."""
         self.next_hazard_id += 1
         return f"haz_{self.next_hazard_id}"
 
+    # --- Hazard index ---
+
+    def _index_hazard(self, hazard_id):
+        hazard = self.active_hazards[hazard_id]
+        room_id = self.symbols.id("room", hazard['location']); type_id = self.symbols.id("hazard_type", hazard['type'])
+        if room_id is None or type_id is None:
+            logging.warning(f"HazardEngine: Hazard {hazard_id} ('{hazard['type']}' in '{hazard['location']}') is not in the level's symbol table. Not indexed.")
+            return
+        self.hazards_by_room.setdefault(room_id, {})[hazard_id] = None
+        self.hazards_by_type.setdefault(type_id, {})[hazard_id] = None
+        if hazard_id not in self._hazard_order: self._hazard_order[hazard_id] = next(self._hazard_sequence)
+
+    def _unindex_hazard(self, hazard_id, hazard):
+        for index, key in ((self.hazards_by_room, self.symbols.id("room", hazard['location'])), (self.hazards_by_type, self.symbols.id("hazard_type", hazard['type']))):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(hazard_id, None)
+                if not bucket: del index[key]
+        self._hazard_order.pop(hazard_id, None)
+
+    def _rebuild_hazard_index(self):
+        self.hazards_by_room.clear(); self.hazards_by_type.clear(); self._hazard_order.clear()
+        for hazard_id in self.active_hazards: self._index_hazard(hazard_id)
+
+    def _clear_active_hazards(self):
+        """Removes every active hazard along with its index entries and environment contributions."""
+        self.active_hazards.clear()
+        self.hazards_by_room.clear(); self.hazards_by_type.clear(); self._hazard_order.clear()
+        self.env_contributions.clear(); self.room_env_contributors.clear(); self.dirty_env_rooms.clear()
+
+    def _move_hazard(self, hazard_id, new_room):
+        """Moves an active hazard to new_room, keeping the room index and its environment contribution current."""
+        hazard = self.active_hazards[hazard_id]
+        old_room_id = self.symbols.id("room", hazard['location']); new_room_id = self.symbols.id("room", new_room)
+        bucket = self.hazards_by_room.get(old_room_id)
+        if bucket is not None:
+            bucket.pop(hazard_id, None)
+            if not bucket: del self.hazards_by_room[old_room_id]
+        hazard['location'] = new_room
+        if new_room_id is not None: self.hazards_by_room.setdefault(new_room_id, {})[hazard_id] = None
+        self._sync_env_contribution(hazard_id)
+
+    def _indexed_hazards(self, hazard_ids):
+        if not hazard_ids: return []
+        if len(hazard_ids) > 1: hazard_ids = sorted(hazard_ids, key=self._hazard_order.__getitem__)
+        return [(hazard_id, self.active_hazards[hazard_id]) for hazard_id in hazard_ids]
+
+    def hazards_in_room(self, room_name, hazard_type=None):
+        """
+        (hazard id, hazard) pairs active in room_name, optionally only those of hazard_type (a type name,
+        or a collection of type names), in the order they were added. Returns a new list, so callers may
+        change hazards while iterating.
+        """
+        hazard_ids = self.hazards_by_room.get(self.symbols.id("room", room_name))
+        if hazard_ids and isinstance(hazard_type, str):
+            of_type = self.hazards_by_type.get(self.symbols.id("hazard_type", hazard_type), {})
+            hazard_ids = [hazard_id for hazard_id in hazard_ids if hazard_id in of_type]
+        elif hazard_ids and hazard_type is not None:
+            hazard_ids = [hazard_id for hazard_id in hazard_ids if self.active_hazards[hazard_id]['type'] in hazard_type]
+        return self._indexed_hazards(hazard_ids)
+
+    def hazards_of_type(self, hazard_type):
+        """(hazard id, hazard) pairs of every active hazard of hazard_type, in the order they were added."""
+        return self._indexed_hazards(self.hazards_by_type.get(self.symbols.id("hazard_type", hazard_type)))
+
+    def nearest_hazards_to_player(self, max_moves=None):
+        """
+        (moves, hazard id, hazard) for active hazards the player's room can be reached from, nearest
+        first (ties in the order they were added), optionally only those within max_moves.
+        Reads the shared player flow field, so this costs one lookup per room that holds hazards.
+        """
+        flow_field = self.game_logic.player_flow_field()
+        if flow_field is None: return []
+        nearby = []
+        for room_id, hazard_ids in self.hazards_by_room.items():
+            moves = flow_field.moves_from_id(room_id)
+            if moves is None or (max_moves is not None and moves > max_moves): continue
+            nearby.extend((moves, hazard_id) for hazard_id in hazard_ids)
+        nearby.sort(key=lambda entry: (entry[0], self._hazard_order[entry[1]]))
+        return [(moves, hazard_id, self.active_hazards[hazard_id]) for moves, hazard_id in nearby]
+
+    def nearest_hazard_to_player(self, max_moves=None, exclude_player_room=False):
+        """(moves, hazard id, hazard) of the nearest active hazard, or None. See nearest_hazards_to_player."""
+        for entry in self.nearest_hazards_to_player(max_moves):
+            if not (exclude_player_room and entry[0] == 0): return entry
+        return None
+
+    def _next_step_toward(self, room_name, target_room):
+        """Next room from room_name towards target_room; towards the player this reads the shared flow field."""
+        if target_room == self.player.location:
+            flow_field = self.game_logic.player_flow_field()
+            return flow_field.next_step(room_name) if flow_field is not None else None
+        return self.game_logic.room_graph.next_step(room_name, target_room)
+
     def initialize_for_level(self, level_id):
         """
         Initializes or resets the HazardEngine for a new game level.
@@ -75,7 +201,7 @@ class HazardEngine:
             level_id (int or str): The identifier of the level to initialize.
         """
         logging.info(f"HazardEngine: Initializing for level {level_id}...")
-        self.active_hazards.clear()
+        self._clear_active_hazards()
         self.room_env.clear()
         self.next_hazard_id = 0 # Reset ID counter for the new level
 
@@ -83,6 +209,7 @@ class HazardEngine:
         if not self.hazards_master_data and self.game_logic and \
            hasattr(self.game_logic, 'game_data') and hasattr(self.game_logic.game_data, 'hazards'):
             self.hazards_master_data = self.game_logic.game_data.hazards
+            self.interaction_matrix = compile_hazard_interaction_matrix(self.hazards_master_data)
             logging.info("HazardEngine: Re-linked hazards_master_data.")
         elif not self.hazards_master_data:
              logging.error("HazardEngine: Cannot initialize level, hazards_master_data is still missing.")
@@ -98,13 +225,14 @@ class HazardEngine:
         for room_name in current_level_rooms_data.keys():
             if self.game_logic and hasattr(self.game_logic, 'game_data') and \
                hasattr(self.game_logic.game_data, 'initial_environmental_conditions'):
-                self.room_env[room_name] = copy.deepcopy(self.game_logic.game_data.initial_environmental_conditions)
+                self.room_env[room_name] = dict(self.game_logic.game_data.initial_environmental_conditions) # Flat scalar defaults
             else:
                 logging.error(f"HazardEngine: game_data.initial_environmental_conditions not found. Cannot set base env for {room_name}.")
                 self.room_env[room_name] = {} # Fallback
 
         # Place hazards defined in the room data for the current level
         self._place_initial_hazards_for_level(level_id, current_level_rooms_data)
+        self.dirty_env_rooms.update(range(self.symbols.count("room"))) # Every room of the level
         
         # After placing initial hazards, update the environmental states based on them
         self.update_environmental_states() 
@@ -122,8 +250,16 @@ class HazardEngine:
         """
         logging.info(f"HazardEngine: Placing initial hazards for Level {level_id}...")
 
+        # Prefer the level compiler's pre-validated placements; parse the room data only without a template
+        level_template = getattr(self.game_logic, 'level_template', None)
+        if level_template and level_template.get("level_id") == level_id:
+            for placement in level_template.get("hazard_placements", []):
+                self._place_compiled_hazard(placement)
+            logging.info(f"HazardEngine: Finished placing initial hazards for level {level_id} from template. Total active: {len(self.active_hazards)}")
+            return
+
         for room_name, room_data in current_level_rooms_data.items():
-            if not isinstance(room_data, dict):
+            if not isinstance(room_data, Mapping): # Dicts or GameLogic's RoomState instances
                 logging.warning(f"HazardEngine: Room data for '{room_name}' is not a dictionary. Skipping hazard placement.")
                 continue
 
@@ -136,6 +272,21 @@ class HazardEngine:
                 self._process_hazard_entry_for_placement(hazard_entry, room_name, room_data, is_possible=True)
         logging.info(f"HazardEngine: Finished placing initial hazards for level {level_id}. Total active: {len(self.active_hazards)}")
 
+    def _place_compiled_hazard(self, placement):
+        """Adds one hazard from a level template placement (see level_templates.compile_level_template)."""
+        if placement["type"] not in self.hazards_master_data: return
+        if placement["is_possible"] and self.rng.random() >= placement["chance"]:
+            return # Did not meet spawn chance
+        if self.hazards_in_room(placement["room"], placement["type"]):
+            return # Already present
+        self._add_active_hazard(
+            hazard_type=placement["type"],
+            location=placement["room"],
+            initial_state_override=placement["initial_state"],
+            target_object_override=placement["object_name_override"],
+            support_object_override=placement["support_object_override"],
+        )
+
     def _process_hazard_entry_for_placement(self, hazard_entry, room_name, room_data, is_possible):
         """
         Helper function to process a single hazard entry from either 
@@ -175,15 +326,12 @@ class HazardEngine:
             return
 
         # Check spawn chance for 'possible_hazards'
-        if is_possible and random.random() >= spawn_chance:
+        if is_possible and self.rng.random() >= spawn_chance:
             return # Did not meet spawn chance
 
         # Prevent duplicate hazards of the same type in the same room if not intended
         # This check might need refinement if multiple instances of same type are allowed with different object_names
-        already_present = any(
-            hz['type'] == hazard_type_to_add and hz['location'] == room_name
-            for hz in self.active_hazards.values()
-        )
+        already_present = bool(self.hazards_in_room(room_name, hazard_type_to_add))
         if already_present:
             # logging.info(f"HazardEngine: Hazard '{hazard_type_to_add}' already present in '{room_name}', skipping duplicate placement.")
             return
@@ -232,7 +380,7 @@ class HazardEngine:
         final_object_name = target_object_override
         if not final_object_name:
             options = base_definition.get("object_name_options", [base_definition.get("name", hazard_type).lower().replace(" ", "_")])
-            final_object_name = random.choice(options) if options else base_definition.get("name", hazard_type)
+            final_object_name = self.rng.choice(options) if options else base_definition.get("name", hazard_type)
 
         # Determine support object (where it's located, e.g., "on the table")
         final_support_object = support_object_override
@@ -244,7 +392,7 @@ class HazardEngine:
             room_data_for_placement = self.rooms.get(location, {})
             
             all_potential_supports_in_room = []
-            if room_data_for_placement and isinstance(room_data_for_placement, dict):
+            if room_data_for_placement and isinstance(room_data_for_placement, Mapping):
                 room_furniture_names = [f.get("name") for f in room_data_for_placement.get("furniture", []) if isinstance(f, dict) and f.get("name")]
                 room_object_names = room_data_for_placement.get("objects", [])
                 all_potential_supports_in_room = room_furniture_names + room_object_names
@@ -253,9 +401,9 @@ class HazardEngine:
             valid_preferred_supports = [s for s in all_potential_supports_in_room if s in preferred_support_types]
 
             if valid_preferred_supports:
-                final_support_object = random.choice(valid_preferred_supports)
+                final_support_object = self.rng.choice(valid_preferred_supports)
             elif all_potential_supports_in_room:
-                final_support_object = random.choice(all_potential_supports_in_room)
+                final_support_object = self.rng.choice(all_potential_supports_in_room)
             else:
                 final_support_object = "an indeterminate spot" 
         
@@ -290,18 +438,18 @@ class HazardEngine:
             "support_object": final_support_object,  # Where it is, e.g., "on the workbench"
             "location": location,
             "state": final_initial_state,
-            "data": copy.deepcopy(base_definition),  # Full master definition for reference during runtime
+            "data": freeze_definition(base_definition),  # Shared read-only master definition for reference during runtime
             "turns_in_state": 0,
             "aggression": base_definition.get("initial_aggression", 0),  # Can be set in master def
             "triggered_by_hazard_id": source_trigger_id,
         }
         
         self.active_hazards[hazard_id] = new_hazard_instance
+        self._index_hazard(hazard_id)
+        self._sync_env_contribution(hazard_id)
         logging.info(f"HazardEngine: Added active hazard ID {hazard_id}, Type '{hazard_type}' (as '{final_object_name}' on/near '{final_support_object}'), Location '{location}', Initial State '{final_initial_state}'.")
         
-        # Apply its initial environmental effect immediately after adding
-        # This will be called by update_environmental_states instead of directly
-        # If a hazard is added mid-game, update_environmental_states should be called.
+        # Its environmental effect is counted by the next update_environmental_states call
         
         return hazard_id
 
@@ -309,7 +457,7 @@ class HazardEngine:
         """Calculates global aggression factor."""
         if not self.game_logic or not self.player: return 0.0
         max_turns = self.game_logic.game_data.STARTING_TURNS 
-        turns_left = self.player.get('turns_left', max_turns)
+        turns_left = self.player.turns_left
         if turns_left <= 0: return 2.0
         turns_used_ratio = (max_turns - turns_left) / float(max_turns)
         aggression = 0.0
@@ -354,7 +502,7 @@ class HazardEngine:
             if req_state and other_h['state'] not in (req_state if isinstance(req_state, list) else [req_state]): continue
             
             chance = min(1.0, max(0.0, rule.get("chance", 0.5) + (rule.get("aggression_influence_on_chance", 0.0) * source_hazard.get("aggression", agg_factor))))
-            if random.random() < chance:
+            if self.rng.random() < chance:
                 msg = rule.get("message", "The {source_hazard_object} reacts with {target_hazard_object}!")
                 messages_list.append(color_text(msg.format(source_hazard_object=source_hazard.get("object_name", source_hazard['type']), target_hazard_object=other_h.get("object_name", other_h['type'])), "warning"))
                 if rule.get("target_state"): self._set_hazard_state(other_h_id, rule["target_state"], messages_list)
@@ -383,7 +531,7 @@ class HazardEngine:
         """Handles falling objects hitting player."""
         # (Simplified logic for brevity - damage, fatality check)
         if self.game_logic.is_game_over: return
-        player_is_present = self.player.get('location') == hazard['location']
+        player_is_present = self.player.location == hazard['location']
         if player_is_present:
             is_fatal = state_data.get("is_fatal_if_direct_hit", state_data.get("instant_death_if_hit", False))
             hit_damage = state_data.get("hit_damage", 0 if is_fatal else 1) # Example damage
@@ -409,49 +557,50 @@ class HazardEngine:
         items_in_room_world_state = self.game_logic.current_level_items_world_state
         player_affected = False
 
-        for item_name, item_data in items_in_room_world_state.items():
-            if item_data.get('location') == room_name and \
-            not item_data.get('container') and \
-            item_data.get('is_floor_hazard'): # Key flag from game_data.py
+        # Only floor items flagged 'is_floor_hazard' in this room, via GameLogic's location index
+        for item_name in sorted(self.game_logic.get_floor_hazard_items(room_name)):
+            item_data = items_in_room_world_state.get(item_name)
+            if not item_data: continue
 
-                floor_hazard_def = item_data.get('floor_hazard_effect')
-                if not floor_hazard_def or not isinstance(floor_hazard_def, dict):
-                    continue
+            floor_hazard_def = item_data.get('floor_hazard_effect')
+            if not floor_hazard_def or not isinstance(floor_hazard_def, dict):
+                continue
 
-                trigger_chance = floor_hazard_def.get('chance', 0.0)
-                if random.random() < trigger_chance:
-                    player_affected = True
-                    effect_message = floor_hazard_def.get('message', f"You encounter a hazard from the {item_name} on the floor!")
-                    messages_list.append(color_text(effect_message.format(item_name=item_name), "warning")) # Use .format in case item_name is needed
-                    logging.info(f"HazardEngine: Player triggered floor hazard '{item_name}' in '{room_name}'.")
-
-                    # Apply status effect
-                    status_def = floor_hazard_def.get('status_effect')
-                    if status_def and isinstance(status_def, dict):
-                        status_name = status_def.get("name")
-                        status_duration = status_def.get("duration")
-                        if status_name:
-                            self.game_logic.apply_status_effect(status_name, status_duration, messages_list)
-                            if self.game_logic.is_game_over: return # Stop if status effect was fatal
-
-                    # Apply HP damage
-                    hp_damage = floor_hazard_def.get('hp_damage', 0) # Often part of status_effect, but can be separate
-                    if 'hp_damage' in status_def : # Prioritize damage from status effect def if also present
-                        hp_damage = status_def.get('hp_damage', hp_damage)
-                    
-                    if hp_damage > 0:
-                        self.game_logic.apply_damage_to_player(hp_damage, f"stepping on {item_name}")
-                        if self.game_logic.is_game_over: return # Stop if damage was fatal
-                    
-                    # Potentially consume or alter the item floor hazard after it triggers
-                    if floor_hazard_def.get("consumes_on_trigger"):
-                        # Remove item from world or mark as 'triggered'
-                        logging.info(f"HazardEngine: Floor hazard '{item_name}' consumed after triggering.")
-                        # Simplest: remove its floor_hazard_effect or is_floor_hazard flag
-                        item_data.pop('is_floor_hazard', None) 
-                        item_data.pop('floor_hazard_effect', None)
-                        # Or, if it's a countable item (like "3 shards"), decrement quantity and remove if zero.
-                        # This would require quantity tracking on world items. For now, just disabling the hazard part.
+            trigger_chance = floor_hazard_def.get('chance', 0.0)
+            if self.rng.random() < trigger_chance:
+                player_affected = True
+                effect_message = floor_hazard_def.get('message', f"You encounter a hazard from the {item_name} on the floor!")
+                messages_list.append(color_text(effect_message.format(item_name=item_name), "warning")) # Use .format in case item_name is needed
+                logging.info(f"HazardEngine: Player triggered floor hazard '{item_name}' in '{room_name}'.")
+
+                # Apply status effect
+                status_def = floor_hazard_def.get('status_effect')
+                if status_def and isinstance(status_def, dict):
+                    status_name = status_def.get("name")
+                    status_duration = status_def.get("duration")
+                    if status_name:
+                        self.game_logic.apply_status_effect(status_name, status_duration, messages_list)
+                        if self.game_logic.is_game_over: return # Stop if status effect was fatal
+
+                # Apply HP damage
+                hp_damage = floor_hazard_def.get('hp_damage', 0) # Often part of status_effect, but can be separate
+                if status_def and 'hp_damage' in status_def: # Prioritize damage from status effect def if also present
+                    hp_damage = status_def.get('hp_damage', hp_damage)
+                
+                if hp_damage > 0:
+                    self.game_logic.apply_damage_to_player(hp_damage, f"stepping on {item_name}")
+                    if self.game_logic.is_game_over: return # Stop if damage was fatal
+                
+                # Potentially consume or alter the item floor hazard after it triggers
+                if floor_hazard_def.get("consumes_on_trigger"):
+                    # Remove item from world or mark as 'triggered'
+                    logging.info(f"HazardEngine: Floor hazard '{item_name}' consumed after triggering.")
+                    # Simplest: remove its floor_hazard_effect or is_floor_hazard flag
+                    item_data.pop('is_floor_hazard', None) 
+                    item_data.pop('floor_hazard_effect', None)
+                    self.game_logic._reindex_item(item_name)
+                    # Or, if it's a countable item (like "3 shards"), decrement quantity and remove if zero.
+                    # This would require quantity tracking on world items. For now, just disabling the hazard part.
 
         # if player_affected: # No real need for a general message if specific ones were added.
             # messages_list.append(color_text("The floor in this room is treacherous!", "warning"))
@@ -472,7 +621,7 @@ class HazardEngine:
         all_room_names = list(self.rooms.keys())
         for room_name in all_room_names:
             if hasattr(self.game_logic, 'game_data') and hasattr(self.game_logic.game_data, 'initial_environmental_conditions'):
-                self.room_env[room_name] = copy.deepcopy(self.game_logic.game_data.initial_environmental_conditions)
+                self.room_env[room_name] = dict(self.game_logic.game_data.initial_environmental_conditions) # Flat scalar defaults
             else: self.room_env[room_name] = {} 
             
             current_room_env = self.room_env[room_name]
@@ -509,10 +658,10 @@ class HazardEngine:
                 if adj_room in self.room_env:
                     adj_gas = self.room_env[adj_room].get('gas_level', 0.0)
                     if gas > adj_gas + self.game_logic.game_data.GAS_SPREAD_DIFFERENCE_THRESHOLD and \
-                       random.random() < self.game_logic.game_data.GAS_SPREAD_CHANCE_PER_EXIT_PER_TURN:
+                       self.rng.random() < self.game_logic.game_data.GAS_SPREAD_CHANCE_PER_EXIT_PER_TURN:
                         spread = min(self.game_logic.game_data.GAS_SPREAD_AMOUNT_PER_TICK, (gas - adj_gas) / 2, gas)
                         deltas[adj_room] += spread; deltas[room_name] -= spread
-            if random.random() < self.game_logic.game_data.GAS_DECAY_CHANCE_PER_TURN:
+            if self.rng.random() < self.game_logic.game_data.GAS_DECAY_CHANCE_PER_TURN:
                 deltas[room_name] -= self.game_logic.game_data.GAS_DECAY_RATE_PER_TURN
         for room_name, delta in deltas.items():
             if room_name in self.room_env and delta != 0:
@@ -531,7 +680,7 @@ class HazardEngine:
                 ign_src = "sparks" if sparking else "flames"
                 messages_list.append(color_text(f"Gas in {room_name} ignites from {ign_src}!", "error"))
                 messages_list.append(color_text("KA-BOOM! Massive explosion!", "error"))
-                if self.player.get('location') == room_name:
+                if self.player.location == room_name:
                     self.game_logic.is_game_over = True; self.game_logic.game_won = False
                     self.player['last_hazard_type'] = "Gas Explosion"; self.player['last_hazard_object_name'] = room_name 
                     messages_list.append(color_text("You are obliterated in the explosion.", "error"))
@@ -541,13 +690,10 @@ class HazardEngine:
                     if hz['location'] == room_name:
                         if hz['type'] == self.game_logic.game_data.HAZARD_TYPE_GAS_LEAK: self._set_hazard_state(hz_id, "sealed_leak", messages_list)
                         elif hz['type'] == self.game_logic.game_data.HAZARD_TYPE_FAULTY_WIRING and hz['state'] in ['sparking', 'arcing']: self._set_hazard_state(hz_id, "shorted_out", messages_list)
-                if self.game_logic.is_game_over and self.player.get('location') == room_name: return
+                if self.game_logic.is_game_over and self.player.location == room_name: return
 
     def check_weak_floorboards_on_move(self, room_name, player_current_weight):
-        active_floorboard_hazards = [
-            (hz_id, hz_instance) for hz_id, hz_instance in self.active_hazards.items()
-            if hz_instance['location'] == room_name and hz_instance['type'] == 'weak_floorboards'
-        ]
+        active_floorboard_hazards = self.hazards_in_room(room_name, 'weak_floorboards')
 
         if not active_floorboard_hazards:
             return None
@@ -566,7 +712,7 @@ class HazardEngine:
 
         logging.debug(f"Checking weak_floorboards in {room_name}. Player weight: {player_current_weight}. Chance: {trigger_chance*100:.2f}%")
 
-        if random.random() < trigger_chance:
+        if self.rng.random() < trigger_chance:
             outcome_state_name = hazard_data.get("room_specific_outcomes", {}).get(room_name)
             if not outcome_state_name: # Fallback if room not in specific outcomes
                 outcome_state_name = "collapsing" 
@@ -762,14 +908,14 @@ class HazardEngine:
                 self.processed_hazards_this_turn.add(hazard_id) # Still mark as processed for this turn cycle
                 
                 # Apply per-turn room effects EVEN IF QTE is active, unless QTE pauses the world
-                player_is_present = self.player.get('location') == hazard['location']
+                player_is_present = self.player.location == hazard['location']
                 if player_is_present and not self.game_logic.is_game_over:
                     self._apply_per_turn_room_effects(hazard_id, hazard, state_data, messages)
                     if self.game_logic.is_game_over: break
                 continue # Skip autonomous actions and state changes for this hazard
             # --- END IMPROVED QTE PAUSE LOGIC ---
 
-            player_is_present = self.player.get('location') == hazard['location']
+            player_is_present = self.player.location == hazard['location']
 
             # 1. Apply Per-Turn Room Effects (if player is present)
             if player_is_present and not self.game_logic.is_game_over:
@@ -800,7 +946,7 @@ class HazardEngine:
                     
                     actual_chance = min(1.0, max(0.0, base_chance + aggro_boost_val))
                     
-                    if random.random() < actual_chance:
+                    if self.rng.random() < actual_chance:
                         self.logger.debug(f"Hazard {hazard_id} progressing state by chance ({actual_chance:.2f}).")
                         self._set_hazard_state(hazard_id, state_data["next_state"], messages)
                         if self.game_logic.is_game_over: break
@@ -817,7 +963,7 @@ class HazardEngine:
                     current_aggression = hazard.get("aggression", agg_factor)
                     effective_revert_chance = base_revert_chance * revert_agg_multiplier 
 
-                    if random.random() < effective_revert_chance:
+                    if self.rng.random() < effective_revert_chance:
                         revert_msg_template = state_data.get("revert_message", "The {object_name} calms down.")
                         messages.append(color_text(revert_msg_template.format(object_name=hazard.get('object_name', hazard['type'])), "info"))
                         self._set_hazard_state(hazard_id, state_data["revert_state"], messages)
@@ -845,7 +991,7 @@ class HazardEngine:
 
             if decay_info and isinstance(decay_info, dict) and not self.game_logic.is_game_over:
                 decay_chance = decay_info.get("chance", 0.05)
-                if random.random() < decay_chance:
+                if self.rng.random() < decay_chance:
                     decay_target_state = decay_info.get("target_state")
                     decay_message_template = decay_info.get("message", "The {object_name} diminishes.")
                     messages.append(color_text(decay_message_template.format(object_name=hazard.get('object_name', hazard['type'])), "info"))
@@ -870,6 +1016,7 @@ class HazardEngine:
         self.logger.debug(f"HazardEngine: --- Turn Update End --- Msgs: {len(messages)}, Death: {death_occurred_this_turn}")
         return list(filter(None, messages)), death_occurred_this_turn
 
+    @profiled_phase("hazards.update")
     def hazard_turn_update(self):
         """
         Processes all active hazards for the current game turn.
@@ -887,29 +1034,33 @@ class HazardEngine:
         logging.debug(f"HazardEngine: --- Hazard Turn Update Start --- Aggression Factor: {agg_factor:.2f}")
 
         # --- Process Temporary Room Effects ---
-        effects_to_remove_indices = []
-        environment_changed_by_temp_effects = False
-        for i, effect in enumerate(self.temporary_room_effects):
-            effect['turns_left'] -= 1
-            if effect['turns_left'] <= 0:
-                effects_to_remove_indices.append(i)
-                # Revert the effect
-                if effect['room'] in self.room_env:
-                    self.room_env[effect['room']][effect['key']] = effect['original_value']
-                    environment_changed_by_temp_effects = True
-                    logging.info(f"HazardEngine: Temporary effect expired in '{effect['room']}': '{effect['key']}' reverted to '{effect['original_value']}'.")
-                    if effect['key'] == 'visibility' and effect['temp_value'] != effect['original_value']:
-                        messages.append(color_text(f"The {effect['key']} in {effect['room']} returns to normal.", "info"))
-        for i in sorted(effects_to_remove_indices, reverse=True):
-            self.temporary_room_effects.pop(i)
-        if environment_changed_by_temp_effects:
-            self.update_environmental_states()
+        with self.profiler.phase("hazards.temporary_effects"):
+            effects_to_remove_indices = []
+            environment_changed_by_temp_effects = False
+            for i, effect in enumerate(self.temporary_room_effects):
+                effect['turns_left'] -= 1
+                if effect['turns_left'] <= 0:
+                    effects_to_remove_indices.append(i)
+                    # Revert the effect
+                    if effect['room'] in self.room_env:
+                        self.room_env[effect['room']][effect['key']] = effect['original_value']
+                        self._mark_env_dirty(effect['room'])
+                        environment_changed_by_temp_effects = True
+                        logging.info(f"HazardEngine: Temporary effect expired in '{effect['room']}': '{effect['key']}' reverted to '{effect['original_value']}'.")
+                        if effect['key'] == 'visibility' and effect['temp_value'] != effect['original_value']:
+                            messages.append(color_text(f"The {effect['key']} in {effect['room']} returns to normal.", "info"))
+            for i in sorted(effects_to_remove_indices, reverse=True):
+                self.temporary_room_effects.pop(i)
+            if environment_changed_by_temp_effects:
+                self.update_environmental_states()
 
         # --- Process Active Hazards ---
         self.processed_hazards_this_turn.clear() 
         active_hazard_ids_this_cycle = list(self.active_hazards.keys())
 
+        hazard_steps = self.profiler.steps("hazards.step") # Per hazard type breakdown of the loop below
         for hazard_id in active_hazard_ids_this_cycle:
+            hazard_steps.next(self.active_hazards[hazard_id]['type'] if hazard_id in self.active_hazards else None)
             if self.game_logic.is_game_over: break
             if hazard_id in self.processed_hazards_this_turn or hazard_id not in self.active_hazards: continue
 
@@ -938,7 +1089,7 @@ class HazardEngine:
                 self.processed_hazards_this_turn.add(hazard_id)
                 continue
 
-            player_is_present = self.player.get('location') == hazard['location']
+            player_is_present = self.player.location == hazard['location']
 
             # 1. Apply Per-Turn Room Effects (if player is present)
             if player_is_present and not self.game_logic.is_game_over:
@@ -969,7 +1120,7 @@ class HazardEngine:
                     
                     actual_chance = min(1.0, max(0.0, base_chance + aggro_boost_val))
                     
-                    if random.random() < actual_chance:
+                    if self.rng.random() < actual_chance:
                         logging.debug(f"Hazard {hazard_id} progressing state by chance ({actual_chance:.2f}).")
                         self._set_hazard_state(hazard_id, state_data["next_state"], messages)
                         if self.game_logic.is_game_over: break
@@ -986,7 +1137,7 @@ class HazardEngine:
                     current_aggression = hazard.get("aggression", agg_factor)
                     effective_revert_chance = base_revert_chance * revert_agg_multiplier 
 
-                    if random.random() < effective_revert_chance:
+                    if self.rng.random() < effective_revert_chance:
                         revert_msg_template = state_data.get("revert_message", "The {object_name} calms down.")
                         messages.append(color_text(revert_msg_template.format(object_name=hazard.get('object_name', hazard['type'])), "info"))
                         self._set_hazard_state(hazard_id, state_data["revert_state"], messages)
@@ -998,8 +1149,9 @@ class HazardEngine:
                         else: continue
 
             # 5. Hazard Interactions (hazard affecting another hazard in the same room)
-            if "hazard_interaction" in state_data and isinstance(state_data["hazard_interaction"], dict) and not self.game_logic.is_game_over:
-                self._handle_hazard_to_hazard_interactions(hazard, state_data["hazard_interaction"], agg_factor, messages)
+            interactions = self.interaction_matrix.get((hazard['type'], current_state_name))
+            if interactions and not self.game_logic.is_game_over:
+                self._handle_hazard_to_hazard_interactions(hazard, interactions, agg_factor, messages)
                 if self.game_logic.is_game_over: break 
                 if hazard_id in self.active_hazards:
                     current_state_name = self.active_hazards[hazard_id]["state"]
@@ -1014,7 +1166,7 @@ class HazardEngine:
 
             if decay_info and isinstance(decay_info, dict) and not self.game_logic.is_game_over:
                 decay_chance = decay_info.get("chance", 0.05)
-                if random.random() < decay_chance:
+                if self.rng.random() < decay_chance:
                     decay_target_state = decay_info.get("target_state")
                     decay_message_template = decay_info.get("message", "The {object_name} diminishes.")
                     messages.append(color_text(decay_message_template.format(object_name=hazard.get('object_name', hazard['type'])), "info"))
@@ -1032,42 +1184,43 @@ class HazardEngine:
                 current_aggression = hazard.get("aggression", agg_factor)
                 actual_spread_chance = min(1.0, max(0.0, spread_chance + (agg_influence_on_spread * current_aggression)))
 
-                if random.random() < actual_spread_chance:
-                    current_fire_room_data = self.rooms.get(hazard['location'])
-                    if current_fire_room_data and current_fire_room_data.get("exits"):
-                        for exit_dir, adj_room_name in current_fire_room_data["exits"].items():
-                            if adj_room_name in self.rooms:
-                                # Check if adjacent room already has fire
-                                adj_room_already_on_fire = False
-                                existing_fire_in_adj_id = None
-                                for adj_h_id, adj_h in self.active_hazards.items():
-                                    if adj_h['location'] == adj_room_name and \
-                                    adj_h['type'] == self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE:
-                                        adj_room_already_on_fire = True
-                                        existing_fire_in_adj_id = adj_h_id
-                                        break
+                with self.profiler.phase("hazards.fire_spread"):
+                    if self.rng.random() < actual_spread_chance:
+                        current_fire_room_data = self.rooms.get(hazard['location'])
+                        if current_fire_room_data and current_fire_room_data.get("exits"):
+                            for exit_dir, adj_room_name in current_fire_room_data["exits"].items():
+                                if adj_room_name in self.rooms:
+                                    # Check if adjacent room already has fire
+                                    adj_fires = self.hazards_in_room(adj_room_name, self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE)
+                                    adj_room_already_on_fire = bool(adj_fires)
+                                    existing_fire_in_adj_id = adj_fires[0][0] if adj_fires else None
                                         
-                                if not adj_room_already_on_fire:
-                                    messages.append(color_text(f"Inferno in {hazard['location']} spreads to {adj_room_name}!", "error"))
-                                    self._add_active_hazard(
-                                        hazard_type=self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE,
-                                        location=adj_room_name,
-                                        initial_state_override="burning_low",
-                                        target_object_override=f"fire from {hazard['location']}",
-                                        support_object_override="room itself"
-                                    )
-                                    if adj_room_name in self.room_env:
-                                        self.room_env[adj_room_name]['is_on_fire'] = True
-                                elif existing_fire_in_adj_id:
-                                    adj_fire_hazard = self.active_hazards.get(existing_fire_in_adj_id)
-                                    if adj_fire_hazard and adj_fire_hazard['state'] == "burning_low":
-                                        messages.append(color_text(f"Fire from {hazard['location']} intensifies blaze in {adj_room_name}!", "error"))
-                                        self._set_hazard_state(existing_fire_in_adj_id, "burning_high", messages)
+                                    if not adj_room_already_on_fire:
+                                        messages.append(color_text(f"Inferno in {hazard['location']} spreads to {adj_room_name}!", "error"))
+                                        self._add_active_hazard(
+                                            hazard_type=self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE,
+                                            location=adj_room_name,
+                                            initial_state_override="burning_low",
+                                            target_object_override=f"fire from {hazard['location']}",
+                                            support_object_override="room itself"
+                                        )
+                                        if adj_room_name in self.room_env:
+                                            self.room_env[adj_room_name]['is_on_fire'] = True
+                                    elif existing_fire_in_adj_id:
+                                        adj_fire_hazard = self.active_hazards.get(existing_fire_in_adj_id)
+                                        if adj_fire_hazard and adj_fire_hazard['state'] == "burning_low":
+                                            messages.append(color_text(f"Fire from {hazard['location']} intensifies blaze in {adj_room_name}!", "error"))
+                                            self._set_hazard_state(existing_fire_in_adj_id, "burning_high", messages)
                                 
-                                if self.game_logic.is_game_over: break
-                        if self.game_logic.is_game_over: break
+                                    if self.game_logic.is_game_over: break
+                            if self.game_logic.is_game_over: break
 
             self.processed_hazards_this_turn.add(hazard_id)
+        hazard_steps.close()
+
+        # Re-aggregate rooms whose hazards moved or changed this turn, then let gas drift between rooms (once per turn)
+        self.update_environmental_states()
+        self._handle_gas_spreading_and_decay()
 
         # After all hazards processed, check for global environmental reactions (e.g., gas explosions)
         if not self.game_logic.is_game_over:
@@ -1105,7 +1258,7 @@ class HazardEngine:
         damage_on_entry = new_state_definition_for_entry_effect.get("on_state_entry_apply_damage")
         
         # Apply on_state_entry_apply_damage if player is present
-        player_is_present_for_entry_damage = self.player.get('location') == hazard['location']
+        player_is_present_for_entry_damage = self.player.location == hazard['location']
         if damage_on_entry and isinstance(damage_on_entry, (int, float)) and damage_on_entry > 0 and player_is_present_for_entry_damage:
             if not self.game_logic.is_game_over:
                 damage_source_name_on_entry = hazard.get('object_name', hazard['name'])
@@ -1121,6 +1274,8 @@ class HazardEngine:
         if new_state_name is None:
             logging.info(f"HazardEngine: Removing hazard {hazard_id} ('{hazard['type']}') from {hazard['location']}.")
             del self.active_hazards[hazard_id]
+            self._unindex_hazard(hazard_id, hazard)
+            self._sync_env_contribution(hazard_id)
             self.update_environmental_states()
             removal_message = hazard['data'].get("removal_message", f"The {hazard.get('object_name', hazard['type'])} is no longer an issue.")
             messages_list.append(color_text(removal_message, "success"))
@@ -1141,6 +1296,7 @@ class HazardEngine:
         hazard['state'] = new_state_name
         hazard['turns_in_state'] = 0
         new_state_definition = hazard_def_states[new_state_name]
+        self._sync_env_contribution(hazard_id)
         self.update_environmental_states()
 
         # Display description of the new state
@@ -1157,7 +1313,7 @@ class HazardEngine:
                 messages_list.append(color_text(f"The {hazard.get('object_name', hazard['name'])} changes.", "warning"))
 
         # Apply effects to player if present in the same room
-        player_is_present = self.player.get('location') == hazard['location']
+        player_is_present = self.player.location == hazard['location']
         if player_is_present and not self.game_logic.is_game_over:
             # Apply HP damage if defined
             hp_damage_on_state_change = new_state_definition.get("instant_hp_damage", 0)
@@ -1207,12 +1363,8 @@ class HazardEngine:
         if new_state_definition.get('sets_room_on_fire') and not self.game_logic.is_game_over:
             room_of_fire_hazard = hazard['location']
             # Check if a 'spreading_fire' hazard already exists in this room
-            existing_room_fire_id = None
-            for active_h_id, active_h_instance in self.active_hazards.items():
-                if active_h_instance.get('type') == self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE and \
-                active_h_instance.get('location') == room_of_fire_hazard:
-                    existing_room_fire_id = active_h_id
-                    break
+            existing_room_fires = self.hazards_in_room(room_of_fire_hazard, self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE)
+            existing_room_fire_id = existing_room_fires[0][0] if existing_room_fires else None
             
             if not existing_room_fire_id:
                 messages_list.append(color_text(f"The {hazard.get('object_name', 'fire from ' + hazard['type'])} ignites the surroundings in {room_of_fire_hazard}!", "error"))
@@ -1248,7 +1400,7 @@ class HazardEngine:
             room_to_unlock_name = new_state_definition['on_state_entry_unlock_room']
             if hasattr(self.game_logic, 'current_level_rooms') and room_to_unlock_name in self.game_logic.current_level_rooms:
                 if self.game_logic.current_level_rooms[room_to_unlock_name].get('locked'):
-                    self.game_logic.current_level_rooms[room_to_unlock_name]['locked'] = False
+                    self.game_logic.set_room_locked(room_to_unlock_name, False)
                     messages_list.append(color_text(f"You hear a click. The {room_to_unlock_name} door seems to have unlocked!", "success"))
                     logging.info(f"Hazard {hazard_id} entering state '{new_state_name}' unlocked room '{room_to_unlock_name}'.")
                 else:
@@ -1268,7 +1420,7 @@ class HazardEngine:
                 chance += agg_influence * current_aggression
                 chance = min(1.0, max(0.0, chance))
 
-                if random.random() < chance:
+                if self.rng.random() < chance:
                     condition_met = True # Assume true unless specific conditions fail
                     if trigger_rule.get("condition") == "player_in_room" and not player_is_present:
                         condition_met = False
@@ -1310,7 +1462,7 @@ class HazardEngine:
         if not self.game_logic or not self.player: return 0.0 
         
         max_turns = self.game_logic.game_data.STARTING_TURNS 
-        turns_left = self.player.get('turns_left', max_turns)
+        turns_left = self.player.turns_left
 
         if turns_left <= 0: return 2.0 # Max aggression if time is up or very low
         
@@ -1364,49 +1516,40 @@ class HazardEngine:
                 self.player['last_hazard_object_name'] = hazard_instance.get('object_name', hazard_instance['type'])
                 logging.info(f"HazardEngine: Player died from being trapped too long with hazard {hazard_id} ('{hazard_instance['type']}') in state '{hazard_instance['state']}'.")
 
-    def _handle_hazard_to_hazard_interactions(self, source_hazard, source_state_interaction_rules, agg_factor, messages_list):
+    @profiled_phase("hazards.interactions")
+    def _handle_hazard_to_hazard_interactions(self, source_hazard, interactions, agg_factor, messages_list):
         """
         Handles interactions where one hazard (source_hazard) in its current state
-        affects other hazards in the same room.
+        affects other hazards in the same room. interactions is the source's row of
+        self.interaction_matrix (target type -> CompiledHazardInteraction), so only
+        hazards of a type the source can react with are visited.
         """
         if self.game_logic.is_game_over: return
 
-        for other_h_id, other_h_instance in list(self.active_hazards.items()): 
+        for other_h_id, other_h_instance in self.hazards_in_room(source_hazard['location'], interactions):
             if self.game_logic.is_game_over: break
-            if other_h_id == source_hazard['id'] or other_h_instance['location'] != source_hazard['location']:
-                continue 
-            
-            interaction_def = source_state_interaction_rules.get(other_h_instance['type']) 
-            if not interaction_def or not isinstance(interaction_def, dict):
+            if other_h_id == source_hazard['id']:
                 continue
 
-            required_target_state = interaction_def.get("requires_target_hazard_state")
-            if required_target_state:
-                other_current_state = other_h_instance['state']
-                if isinstance(required_target_state, list) and other_current_state not in required_target_state:
-                    continue
-                elif isinstance(required_target_state, str) and other_current_state != required_target_state:
-                    continue
-            
-            base_interaction_chance = interaction_def.get("chance", 0.5)
-            agg_boost_on_interaction = interaction_def.get("aggression_influence_on_chance", 0.0) * source_hazard.get("aggression", agg_factor)
-            final_interaction_chance = min(1.0, max(0.0, base_interaction_chance + agg_boost_on_interaction))
+            interaction = interactions[other_h_instance['type']]
+            if interaction.required_states is not None and other_h_instance['state'] not in interaction.required_states:
+                continue
+
+            agg_boost_on_interaction = interaction.aggression_influence_on_chance * source_hazard.get("aggression", agg_factor)
+            final_interaction_chance = min(1.0, max(0.0, interaction.chance + agg_boost_on_interaction))
 
-            if random.random() < final_interaction_chance:
-                interaction_msg_template = interaction_def.get("message", "The {source_hazard_object} reacts with the {target_hazard_object}!")
-                messages_list.append(color_text(interaction_msg_template.format(
+            if self.rng.random() < final_interaction_chance:
+                messages_list.append(color_text(interaction.message.format(
                     source_hazard_object=source_hazard.get("object_name", source_hazard['type']),
                     target_hazard_object=other_h_instance.get("object_name", other_h_instance['type'])
                 ), "warning"))
 
-                target_new_state = interaction_def.get("target_state")
-                if target_new_state:
-                    self._set_hazard_state(other_h_id, target_new_state, messages_list)
-                    if self.game_logic.is_game_over: return 
-                
-                source_new_state_after_interaction = interaction_def.get("source_target_state")
-                if source_new_state_after_interaction and source_hazard['id'] in self.active_hazards: 
-                    self._set_hazard_state(source_hazard['id'], source_new_state_after_interaction, messages_list)
+                if interaction.target_state:
+                    self._set_hazard_state(other_h_id, interaction.target_state, messages_list)
+                    if self.game_logic.is_game_over: return
+
+                if interaction.source_target_state and source_hazard['id'] in self.active_hazards:
+                    self._set_hazard_state(source_hazard['id'], interaction.source_target_state, messages_list)
                     if self.game_logic.is_game_over: return
                     return # Source hazard changed, its turn update for interactions is done.
 
@@ -1414,12 +1557,12 @@ class HazardEngine:
     # These are called by hazard_turn_update via getattr if defined in a hazard's state.
 
     def _move_hazard_toward_player(self, hazard_id, hazard_instance, state_data, messages_list): # state_data passed for context
-        """Moves a mobile hazard one step closer to the player using BFS pathfinding."""
+        """Moves a mobile hazard one step closer to the player along the shared player flow field."""
         if not hazard_instance['data'].get('can_move_between_rooms'):
             logging.debug(f"Hazard {hazard_id} cannot move between rooms.")
             return
 
-        player_room = self.player['location']
+        player_room = self.player.location
         current_hazard_room = hazard_instance['location']
 
         if current_hazard_room == player_room:
@@ -1436,10 +1579,10 @@ class HazardEngine:
         agg_influence_on_seek = state_data.get("aggression_influence", {}).get("player_seek_chance_boost", 0.1) * agg_factor_for_seek
         current_seek_chance = min(1.0, max(0.0, base_seek_chance + agg_influence_on_seek))
 
-        if random.random() > current_seek_chance:
+        if self.rng.random() > current_seek_chance:
             logging.debug(f"Hazard {hazard_id} did not seek player this turn (chance: {current_seek_chance:.2f}).")
             # Optional: random movement if not seeking but aggressive and allowed by state
-            if agg_factor_for_seek > 1.0 and random.random() < (agg_factor_for_seek * 0.05) and state_data.get('can_move_randomly_if_not_seeking'):
+            if agg_factor_for_seek > 1.0 and self.rng.random() < (agg_factor_for_seek * 0.05) and state_data.get('can_move_randomly_if_not_seeking'):
                 room_data_for_move = self.rooms.get(current_hazard_room) # self.rooms is GameLogic's current_level_rooms
                 if room_data_for_move and room_data_for_move.get("exits"):
                     possible_next_rooms = [
@@ -1447,15 +1590,14 @@ class HazardEngine:
                         if r_name in self.rooms and not self.rooms[r_name].get('locked')
                     ]
                     if possible_next_rooms:
-                        hazard_instance['location'] = random.choice(possible_next_rooms)
+                        self._move_hazard(hazard_id, self.rng.choice(possible_next_rooms))
                         messages_list.append(color_text(f"The {hazard_instance.get('object_name', 'hazard')} wanders aimlessly to the {hazard_instance['location']}.", "info"))
                         logging.info(f"Hazard {hazard_id} moved randomly to {hazard_instance['location']}.")
             return
 
         # Pathfinding
-        full_path = self._get_shortest_path(current_hazard_room, player_room)
-        if full_path and len(full_path) > 1:
-            next_step_room = full_path[1]
+        next_step_room = self._next_step_toward(current_hazard_room, player_room)
+        if next_step_room:
             
             # Movement constraints check (example)
             # movement_constraints = hazard_instance['data'].get("movement_constraints")
@@ -1464,7 +1606,7 @@ class HazardEngine:
             #        logging.debug(f"Hazard {hazard_id} cannot move to {next_step_room} due to floor constraint.")
             #        return
 
-            hazard_instance['location'] = next_step_room
+            self._move_hazard(hazard_id, next_step_room)
             
             move_msg_template_key = "move_description_seek" if next_step_room != player_room else "enter_player_room_description_seek"
             desc_template = state_data.get(move_msg_template_key, 
@@ -1486,13 +1628,13 @@ class HazardEngine:
     def _handle_hazard_player_room_entry(self, hazard_id, hazard_instance, state_data, messages_list):
         """Handles effects when a mobile hazard enters or is already in the player's room."""
         if self.game_logic.is_game_over: return
-        if self.player.get('location') != hazard_instance['location']: return # Should not happen if called correctly
+        if self.player.location != hazard_instance['location']: return # Should not happen if called correctly
 
         logging.debug(f"Hazard {hazard_id} ('{hazard_instance['type']}') in same room as player. Checking for collision/effects.")
         
         # Check for collision effects defined in the hazard's master data (collision_effects.player)
         player_collision_rules = hazard_instance['data'].get('collision_effects', {}).get('player', {})
-        if player_collision_rules and random.random() < player_collision_rules.get('chance', 0.0):
+        if player_collision_rules and self.rng.random() < player_collision_rules.get('chance', 0.0):
             effect_type = player_collision_rules.get('effect')
             collision_msg = player_collision_rules.get("message", f"The {hazard_instance.get('object_name','hazard')} collides with you!")
             messages_list.append(color_text(collision_msg, "warning"))
@@ -1520,41 +1662,23 @@ class HazardEngine:
         # This function is more about the *entry* or *direct bump* interaction.
 
     def _get_shortest_path(self, start_room, end_room):
-        """Simple BFS to find the shortest path (list of room names) between two rooms."""
+        """
+        Shortest path (list of room names) between two rooms, through unlocked rooms only.
+        Read from GameLogic.room_graph's cached tables; see room_graph.py.
+        """
         if start_room == end_room: return [start_room] # Path to self is just self
         if not self.rooms: # self.rooms is GameLogic's current_level_rooms
             logging.warning("_get_shortest_path: No room data available (self.rooms is empty/None).")
-            return None 
-
-        queue = collections.deque([(start_room, [start_room])])
-        visited = {start_room}
-
-        while queue:
-            current_room_name, path = queue.popleft()
-            # Access room data using self.rooms (which points to GameLogic's current_level_rooms)
-            current_room_data = self.rooms.get(current_room_name) 
-            if not current_room_data or not isinstance(current_room_data.get("exits"), dict):
-                continue # Skip if room data or exits are invalid
-
-            for _, next_room_candidate_name in current_room_data["exits"].items():
-                if next_room_candidate_name == end_room:
-                    return path + [next_room_candidate_name]
-                
-                if next_room_candidate_name not in visited:
-                    next_room_data = self.rooms.get(next_room_candidate_name)
-                    # Pathfind only through unlocked rooms
-                    if next_room_data and not next_room_data.get('locked', False):
-                        visited.add(next_room_candidate_name)
-                        queue.append((next_room_candidate_name, path + [next_room_candidate_name]))
-        
-        logging.debug(f"No path found from {start_room} to {end_room}.")
-        return None # No path found
+            return None
+        path = self.game_logic.room_graph.path(start_room, end_room)
+        if path is None: logging.debug(f"No path found from {start_room} to {end_room}.")
+        return path
 
     # --- Stubs for other autonomous actions mentioned in game_data.hazards ---
     def _check_hit_player(self, hazard_id, hazard_instance, state_data, messages_list):
         """Placeholder for hazards that might hit the player (e.g., falling objects)."""
         if self.game_logic.is_game_over: return
-        player_is_present = self.player.get('location') == hazard_instance['location']
+        player_is_present = self.player.location == hazard_instance['location']
         if player_is_present:
             # Logic from wobbly_ceiling_fan or loose_object
             hit_damage = state_data.get("hit_damage", state_data.get("instant_hp_damage", 0)) # Use a consistent key or prioritize
@@ -1586,14 +1710,14 @@ class HazardEngine:
     def _check_player_slip(self, hazard_id, hazard_instance, state_data, messages_list):
         """Placeholder for hazards that might cause the player to slip (e.g., water puddle)."""
         if self.game_logic.is_game_over: return
-        player_is_present = self.player.get('location') == hazard_instance['location']
+        player_is_present = self.player.location == hazard_instance['location']
         if player_is_present:
             # Logic for slipping, e.g. from water_puddle's slip_hazard state
             slip_damage = state_data.get("slip_damage", 0)
             slip_message_template = state_data.get("slip_message", "You slip on the {object_name}!")
             
             # Chance to slip can be added here if not 100%
-            # if random.random() < state_data.get("slip_chance", 1.0):
+            # if self.rng.random() < state_data.get("slip_chance", 1.0):
             messages_list.append(color_text(slip_message_template.format(
                 object_name=hazard_instance.get('object_name', hazard_instance['type'])
             ), "warning"))
@@ -1607,7 +1731,7 @@ class HazardEngine:
     def _check_fall_through(self, hazard_id, hazard_instance, state_data, messages_list):
         """Placeholder for hazards where player might fall through (e.g., weak floorboards collapsing not due to direct move)."""
         if self.game_logic.is_game_over: return
-        player_is_present = self.player.get('location') == hazard_instance['location']
+        player_is_present = self.player.location == hazard_instance['location']
         if player_is_present:
             # This is for spontaneous collapse. Movement-triggered collapse is in GameLogic/check_weak_floorboards_on_move
             fall_outcome_message = state_data.get("fall_outcome_message", "The floor beneath you gives way!")
@@ -1669,7 +1793,7 @@ class HazardEngine:
             # Initialize if missing, though it should be set up by initialize_for_level
             if location and self.game_logic and hasattr(self.game_logic, 'game_data') and \
                hasattr(self.game_logic.game_data, 'initial_environmental_conditions'):
-                self.room_env[location] = copy.deepcopy(self.game_logic.game_data.initial_environmental_conditions)
+                self.room_env[location] = dict(self.game_logic.game_data.initial_environmental_conditions)
             else:
                 return # Cannot proceed
 
@@ -1708,111 +1832,81 @@ class HazardEngine:
         logging.debug(f"HazardEngine: Final room_env for '{location}' after direct effect: {current_room_env}")
 
 
+    @profiled_phase("hazards.environment")
     def update_environmental_states(self):
         """
-        Recalculates the environmental state for all rooms based on the current
-        active states of all hazards. This is the definitive update for room_env.
+        Brings room_env up to date with the active hazards. Each hazard's environmental_effect is
+        registered per room by _sync_env_contribution whenever the hazard is added, moves, changes
+        state or is removed, which marks the rooms involved dirty; only dirty rooms are rebuilt here
+        (base conditions + contributions). Other rooms keep their current values, including active
+        temporary effects. Gas spreading and decay run once per turn from hazard_turn_update.
         """
         if not self.game_logic or not self.rooms: 
             logging.error("HazardEngine.update_environmental_states: GameLogic or current_level_rooms not available.")
             return
-
-        all_room_names_in_level = list(self.rooms.keys()) # Get all rooms for the current level
-
-        for room_name in all_room_names_in_level:
-            # Reset to base conditions for the room before recalculating
-            if self.game_logic and hasattr(self.game_logic, 'game_data') and \
-               hasattr(self.game_logic.game_data, 'initial_environmental_conditions'):
-                self.room_env[room_name] = copy.deepcopy(self.game_logic.game_data.initial_environmental_conditions)
-            else: # Should not happen if initialized correctly
-                self.room_env[room_name] = {} 
-            
-            current_room_env_being_built = self.room_env[room_name]
-
-            # Aggregate effects from all hazards active in this room
-            for hazard_instance in self.active_hazards.values():
-                if hazard_instance.get("location") == room_name:
-                    state_data = hazard_instance.get("data", {}).get("states", {}).get(hazard_instance.get("state"))
-                    if state_data and "environmental_effect" in state_data:
-                        env_effects_def = state_data["environmental_effect"]
-                        for effect_key, effect_value_def in env_effects_def.items():
-                            if effect_key not in current_room_env_being_built: 
-                                logging.warning(f"HazardEngine: Effect key '{effect_key}' from hazard '{hazard_instance.get('type')}' not in base env conditions for room '{room_name}'. Adding it.")
-                                # current_room_env_being_built[effect_key] = None # Or some default based on type
-                                # Better to ensure initial_environmental_conditions is complete.
-                                # For now, we'll only operate on keys already present from initial_environmental_conditions.
-                                continue
-
-                            # Logic for applying/aggregating effects:
-                            # Booleans: if any hazard sets it true, it's true.
-                            if isinstance(current_room_env_being_built[effect_key], bool):
-                                if isinstance(effect_value_def, bool) and effect_value_def:
-                                    current_room_env_being_built[effect_key] = True
-                            
-                            # Numeric (like gas_level, noise_level): sum changes or take max?
-                            # Current _apply_environmental_effect_from_hazard uses direct set or +/-.
-                            # For an aggregate, summing changes or taking max is more common.
-                            # Let's refine: gas_level and noise_level should accumulate.
-                            elif effect_key in ["gas_level", "noise_level"]:
-                                base_val = self.game_logic.game_data.initial_environmental_conditions.get(effect_key, 0)
-                                current_val_in_room = current_room_env_being_built.get(effect_key, base_val)
-                                
-                                change = 0.0
-                                if isinstance(effect_value_def, (int, float)): # If it's an absolute value from hazard
-                                    # This interpretation is tricky. Does each hazard *set* the level, or *add* to it?
-                                    # Let's assume hazard definitions provide an *absolute contribution* or a *delta*.
-                                    # If it's a delta (e.g. "+1"), it should be parsed.
-                                    # If it's absolute (e.g. "2"), how to aggregate? Max? Sum?
-                                    # The _apply_environmental_effect_from_hazard parses "+/-" for deltas.
-                                    # For aggregation, let's assume effect_value_def from hazard is its *contribution*.
-                                    # So, we sum these contributions relative to the base.
-                                    # This means effect_value_def should represent the *change* from normal.
-                                    # E.g., gas_leak state: {"gas_level": "+1"} means it adds 1 to base.
-                                    # Or, if {"gas_level": 1}, it means it contributes 1.
-                                    # Let's assume the latter for aggregation: sum of contributions.
-                                    # This means initial_environmental_conditions should be all zeros for accumulables.
-                                    
-                                    # Re-evaluating: Simpler if hazard state just *sets* a property.
-                                    # If multiple hazards set 'is_sparking', it's true.
-                                    # If one sets gas_level to 1 and another to 2, what's the room level? Max?
-                                    # Let's use the logic from _apply_environmental_effect_from_hazard for individual application.
-                                    # The aggregation should take the "strongest" effect.
-                                    
-                                    # For numeric values like gas_level, let's take the MAX value set by any hazard.
-                                    if isinstance(effect_value_def, (int, float)):
-                                        current_room_env_being_built[effect_key] = max(current_val_in_room, effect_value_def)
-                                    elif isinstance(effect_value_def, str) and (effect_value_def.startswith('+') or effect_value_def.startswith('-')):
-                                        try:
-                                            delta = float(effect_value_def)
-                                            # This is complex for aggregation. Let's assume direct setting for now.
-                                            # If we sum deltas, we need to start from base for each hazard.
-                                            # Sticking to MAX for simplicity in aggregation of absolute values from hazards.
-                                            # If a hazard says "gas_level: 2", the room's gas_level becomes at least 2.
-                                        except ValueError: pass
-
-
-                            # Strings (like visibility): last one wins or specific hierarchy?
-                            elif isinstance(current_room_env_being_built[effect_key], str):
-                                # Example: if one hazard makes visibility "smoky" and another "dense_smoke",
-                                # "dense_smoke" should prevail. Requires an order of severity.
-                                severity_order = {"normal":0, "dim":1, "hazy":1, "dark":2, "patchy_smoke":2, "very_dark":3, "dense_smoke":3, "zero":4}
-                                current_severity = severity_order.get(current_room_env_being_built[effect_key].lower(), -1)
-                                new_effect_severity = severity_order.get(str(effect_value_def).lower(), -1)
-                                if new_effect_severity > current_severity:
-                                    current_room_env_being_built[effect_key] = str(effect_value_def)
-            
-            # Clamp accumulated/maxed values after all hazards in the room are processed
-            if "gas_level" in current_room_env_being_built: 
-                current_room_env_being_built["gas_level"] = max(0.0, min(4.0, current_room_env_being_built["gas_level"]))
-            if "noise_level" in current_room_env_being_built: 
-                current_room_env_being_built["noise_level"] = max(0, min(5, int(current_room_env_being_built["noise_level"])))
-            
-            logging.debug(f"HazardEngine: Final aggregated environmental state for room '{room_name}': {current_room_env_being_built}")
-
-        # After updating all rooms based on local hazards, handle inter-room effects like gas spreading
-        self._handle_gas_spreading_and_decay()
-
-
+        if not self.dirty_env_rooms: return
+
+        base_conditions = getattr(self.game_logic.game_data, 'initial_environmental_conditions', {})
+        room_names = self.symbols.names["room"]
+        for room_id in self.dirty_env_rooms:
+            room_name = room_names[room_id]
+            if room_name not in self.rooms: continue
+            self.room_env[room_name] = self._aggregate_room_env(room_id, room_name, base_conditions)
+            logging.debug(f"HazardEngine: Final aggregated environmental state for room '{room_name}': {self.room_env[room_name]}")
+        self.dirty_env_rooms.clear()
+
+    def _sync_env_contribution(self, hazard_id):
+        """
+        Re-registers the environmental_effect of a hazard's current state and room (or drops it if
+        the hazard is gone), marking the rooms it left or entered dirty when the contribution changed.
+        """
+        hazard = self.active_hazards.get(hazard_id)
+        contribution = None
+        if hazard:
+            state_data = hazard.get("data", {}).get("states", {}).get(hazard.get("state"))
+            room_id = self.symbols.id("room", hazard.get("location"))
+            if state_data and state_data.get("environmental_effect") and room_id is not None:
+                contribution = (room_id, state_data["environmental_effect"])
+        previous = self.env_contributions.get(hazard_id)
+        if previous == contribution: return
+        if previous:
+            self.room_env_contributors.get(previous[0], {}).pop(hazard_id, None); self.dirty_env_rooms.add(previous[0])
+        if contribution:
+            self.env_contributions[hazard_id] = contribution
+            self.room_env_contributors.setdefault(contribution[0], {})[hazard_id] = contribution[1]; self.dirty_env_rooms.add(contribution[0])
+        else: self.env_contributions.pop(hazard_id, None)
+
+    def _mark_env_dirty(self, room_name):
+        room_id = self.symbols.id("room", room_name)
+        if room_id is not None: self.dirty_env_rooms.add(room_id)
+
+    def _aggregate_room_env(self, room_id, room_name, base_conditions):
+        """
+        Base conditions combined with the effects of the room's hazards: booleans OR together,
+        numbers take the maximum and visibility takes the most severe value. Relative gas/noise
+        values ("+1") are not aggregated. Active temporary effects for the room are re-applied on top.
+        """
+        room_env = dict(base_conditions) # Flat scalar defaults
+        for hazard_id, env_effects_def in self.room_env_contributors.get(room_id, {}).items():
+            for effect_key, effect_value_def in env_effects_def.items():
+                if effect_key not in room_env:
+                    hazard_type = self.active_hazards.get(hazard_id, {}).get('type')
+                    logging.warning(f"HazardEngine: Effect key '{effect_key}' from hazard '{hazard_type}' not in base env conditions for room '{room_name}'. Ignoring it.")
+                    continue
+                current_value = room_env[effect_key]
+                if isinstance(current_value, bool):
+                    if isinstance(effect_value_def, bool) and effect_value_def: room_env[effect_key] = True
+                elif effect_key in ("gas_level", "noise_level"):
+                    if isinstance(effect_value_def, (int, float)): room_env[effect_key] = max(current_value, effect_value_def)
+                elif isinstance(current_value, str):
+                    if VISIBILITY_SEVERITY.get(str(effect_value_def).lower(), -1) > VISIBILITY_SEVERITY.get(current_value.lower(), -1):
+                        room_env[effect_key] = str(effect_value_def)
+        # Clamp accumulated/maxed values after all hazards in the room are processed
+        if "gas_level" in room_env: room_env["gas_level"] = max(0.0, min(4.0, room_env["gas_level"]))
+        if "noise_level" in room_env: room_env["noise_level"] = max(0, min(5, int(room_env["noise_level"])))
+        for effect in self.temporary_room_effects:
+            if effect['room'] == room_name and effect['key'] in room_env: room_env[effect['key']] = effect['temp_value']
+        return room_env
 
     def _handle_gas_spreading_and_decay(self):
         """Handles gas diffusion between connected rooms and natural decay of gas in rooms."""
@@ -1835,8 +1929,8 @@ class HazardEngine:
                     adjacent_gas_level = adjacent_env_state.get('gas_level', 0.0)
                     
                     # Condition for spreading: significant difference and random chance
-                    if current_gas_level > adjacent_gas_level + self.game_logic.game_data.GAS_SPREAD_DIFFERENCE_THRESHOLD (0.5): # e.g., spread if diff > 0.5
-                        if random.random() < self.game_logic.game_data.GAS_SPREAD_CHANCE_PER_EXIT_PER_TURN:
+                    if current_gas_level > adjacent_gas_level + self.game_logic.game_data.GAS_SPREAD_DIFFERENCE_THRESHOLD: # e.g., spread if diff > 0.5
+                        if self.rng.random() < self.game_logic.game_data.GAS_SPREAD_CHANCE_PER_EXIT_PER_TURN:
                             spread_amount = self.game_logic.game_data.GAS_SPREAD_AMOUNT_PER_TICK 
                             
                             # Ensure spread doesn't make source negative or target exceed source (simple model)
@@ -1850,7 +1944,7 @@ class HazardEngine:
         for room_name, env_state in self.room_env.items():
             current_gas_level = env_state.get('gas_level', 0.0)
             if current_gas_level > 0:
-                if random.random() < self.game_logic.game_data.GAS_DECAY_CHANCE_PER_TURN:
+                if self.rng.random() < self.game_logic.game_data.GAS_DECAY_CHANCE_PER_TURN:
                     decay_amount = self.game_logic.game_data.GAS_DECAY_RATE_PER_TURN
                     gas_deltas[room_name] -= decay_amount # Decay reduces gas
                     logging.debug(f"HazardEngine: Gas decay in '{room_name}': -{decay_amount:.2f}. Current before delta: {current_gas_level:.2f}")
@@ -1863,6 +1957,7 @@ class HazardEngine:
                 logging.info(f"HazardEngine: Room '{room_name}' gas level changed by {delta:.2f} to {self.room_env[room_name]['gas_level']:.2f}.")
 
 
+    @profiled_phase("hazards.global_reactions")
     def _check_global_environmental_reactions(self, messages_list):
         """
         Checks for room-wide environmental reactions based on the aggregated
@@ -1888,7 +1983,7 @@ class HazardEngine:
                 logging.info(f"HazardEngine: Gas explosion in '{room_name}' due to gas level {gas_level:.2f} and ignition source '{ignition_source_str}'.")
                 
                 # Player in room?
-                if self.player.get('location') == room_name:
+                if self.player.location == room_name:
                     self.game_logic.is_game_over = True
                     self.game_logic.game_won = False
                     self.player['last_hazard_type'] = "Gas Explosion"
@@ -1903,23 +1998,23 @@ class HazardEngine:
                 env_data['noise_level'] = 5 
 
                 # Deactivate specific hazards in this room that contributed or would be consumed
-                for hz_id, hz_instance in list(self.active_hazards.items()):
-                    if hz_instance['location'] == room_name:
-                        if hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_GAS_LEAK:
-                            # Gas leak source might be destroyed or just stop leaking
-                            self._set_hazard_state(hz_id, "sealed_leak", messages_list) # Or a new "exploded_pipe" state
-                        elif hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_FAULTY_WIRING and \
-                             hz_instance['state'] in ['sparking', 'arcing']:
-                            self._set_hazard_state(hz_id, "shorted_out", messages_list)
-                        elif hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE: # If room fire was already there
-                            # It might intensify or just continue. For now, no change to its state,
-                            # as the room env 'is_on_fire' is now true.
-                            pass
-                        # Consider other hazards that might be destroyed by an explosion
-
-                if self.game_logic.is_game_over and self.player.get('location') == room_name:
+                for hz_id, hz_instance in self.hazards_in_room(room_name):
+                    if hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_GAS_LEAK:
+                        # Gas leak source might be destroyed or just stop leaking
+                        self._set_hazard_state(hz_id, "sealed_leak", messages_list) # Or a new "exploded_pipe" state
+                    elif hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_FAULTY_WIRING and \
+                         hz_instance['state'] in ['sparking', 'arcing']:
+                        self._set_hazard_state(hz_id, "shorted_out", messages_list)
+                    elif hz_instance['type'] == self.game_logic.game_data.HAZARD_TYPE_SPREADING_FIRE: # If room fire was already there
+                        # It might intensify or just continue. For now, no change to its state,
+                        # as the room env 'is_on_fire' is now true.
+                        pass
+                    # Consider other hazards that might be destroyed by an explosion
+
+                if self.game_logic.is_game_over and self.player.location == room_name:
                     return # Player died in this room's explosion, stop checking other rooms.
             
+    @profiled_phase("hazards.action")
     def check_action_hazard(self, verb, target_name, current_room_name, item_used=None):
         agg_factor = self._calculate_aggression_factor()
         action_messages = []
@@ -1929,9 +2024,8 @@ class HazardEngine:
 
         # --- Part 1: Check for DIRECT interactions (player's target IS the hazard or its support) ---
         # This part is largely your existing logic.
-        for hazard_id, hazard in list(self.active_hazards.items()):
+        for hazard_id, hazard in self.hazards_in_room(current_room_name):
             if self.game_logic.is_game_over: break
-            if hazard['location'] != current_room_name: continue
 
             is_direct_target_of_action = (
                 target_name.lower() == hazard.get('object_name','').lower() or
@@ -1958,9 +2052,8 @@ class HazardEngine:
 
         # --- Part 2: Check for INDIRECT interactions (action on target_name affects OTHER hazards) ---
         if not action_caused_death: # Only proceed if direct interaction wasn't fatal
-            for hazard_id, hazard_b in list(self.active_hazards.items()): # Hazard B (the one potentially affected)
+            for hazard_id, hazard_b in self.hazards_in_room(current_room_name): # Hazard B (the one potentially affected)
                 if self.game_logic.is_game_over: break
-                if hazard_b['location'] != current_room_name: continue
 
                 indirect_trigger_rules = hazard_b['data'].get("triggered_by_room_action", [])
                 for rule in indirect_trigger_rules:
@@ -2005,7 +2098,7 @@ class HazardEngine:
                             # aggression can influence this too
                             actual_indirect_chance = min(1.0, max(0.0, base_indirect_chance + (agg_factor * rule.get("aggression_modifier", 0.0))))
 
-                            if random.random() < actual_indirect_chance:
+                            if self.rng.random() < actual_indirect_chance:
                                 interaction_occurred_indirectly = True # Use a different flag or add to a list of interactions
                                 effect_on_hazard_b = rule.get("effect_on_self", {})
                                 
@@ -2041,7 +2134,7 @@ class HazardEngine:
             room_name (str): The name of the room.
 
         Returns:
-            dict: A copy of the room's environmental state dictionary. 
+            dict: A shallow copy of the room's environmental state dictionary (values are scalars).
                   Returns a copy of initial_environmental_conditions if room not found.
         """
         if not self.game_logic or not hasattr(self.game_logic, 'game_data') or \
@@ -2049,8 +2142,8 @@ class HazardEngine:
             logging.error("HazardEngine.get_env_state: Missing game_data.initial_environmental_conditions.")
             return {} # Should not happen with proper setup
 
-        return copy.deepcopy(self.room_env.get(room_name, 
-                            copy.deepcopy(self.game_logic.game_data.initial_environmental_conditions)))
+        env = self.room_env.get(room_name)
+        return dict(env if env is not None else self.game_logic.game_data.initial_environmental_conditions)
 
     def _move_and_interact(self, hazard_id, hazard_instance, state_data, messages_list):
         """
@@ -2077,12 +2170,12 @@ class HazardEngine:
                 closest_target_hazard_room = None
                 shortest_path_len = float('inf')
 
-                for other_h_id, other_h in self.active_hazards.items():
-                    if other_h['type'] in seekable_hazard_types:
-                        path_to_other_h = self._get_shortest_path(original_room, other_h['location'])
-                        if path_to_other_h and len(path_to_other_h) < shortest_path_len:
-                            shortest_path_len = len(path_to_other_h)
-                            closest_target_hazard_room = other_h['location']
+                seekable_hazards = self._indexed_hazards([h_id for h_type in seekable_hazard_types for h_id in self.hazards_by_type.get(self.symbols.id("hazard_type", h_type), ())])
+                for other_h_id, other_h in seekable_hazards:
+                    moves_to_other_h = self.game_logic.room_graph.moves_between(original_room, other_h['location'])
+                    if moves_to_other_h is not None and moves_to_other_h < shortest_path_len:
+                        shortest_path_len = moves_to_other_h
+                        closest_target_hazard_room = other_h['location']
                 
                 if closest_target_hazard_room:
                     target_room_for_move = closest_target_hazard_room
@@ -2101,14 +2194,14 @@ class HazardEngine:
             if not primary_target_sought and (movement_logic == "seek_target_type_then_player" or movement_logic == "seek_player_bfs"):
                 player_seek_chance_base = state_data.get('player_seek_chance', hazard_instance['data'].get('player_seek_chance_if_no_primary_target', 0.1))
                 agg_influence_seek = hazard_instance['data'].get('aggression_influence', {}).get('player_seek_chance_boost', 0.0) * agg_factor
-                if random.random() < (player_seek_chance_base + agg_influence_seek):
-                    target_room_for_move = self.player['location']
+                if self.rng.random() < (player_seek_chance_base + agg_influence_seek):
+                    target_room_for_move = self.player.location
                     logging.debug(f"Hazard {hazard_id} seeking player, aiming for room: {target_room_for_move}")
 
             if target_room_for_move and target_room_for_move != original_room:
-                path = self._get_shortest_path(original_room, target_room_for_move)
-                if path and len(path) > 1:
-                    next_room_candidate = path[1]
+                next_step_room = self._next_step_toward(original_room, target_room_for_move)
+                if next_step_room:
+                    next_room_candidate = next_step_room
             elif state_data.get('can_move_randomly_if_not_seeking', False): # Random movement if no target and allowed
                 room_data_current = self.rooms.get(original_room)
                 if room_data_current and room_data_current.get("exits"):
@@ -2117,12 +2210,12 @@ class HazardEngine:
                         if r_name in self.rooms and not self.rooms[r_name].get('locked')
                     ]
                     if possible_next_rooms:
-                        next_room_candidate = random.choice(possible_next_rooms)
+                        next_room_candidate = self.rng.choice(possible_next_rooms)
                         logging.debug(f"Hazard {hazard_id} moving randomly to: {next_room_candidate}")
 
         # 2. Execute Movement
         if next_room_candidate != original_room:
-            hazard_instance['location'] = next_room_candidate
+            self._move_hazard(hazard_id, next_room_candidate)
             move_desc = hazard_instance['data'].get('move_description', "The {object_name} moves.")
             messages_list.append(color_text(move_desc.format(object_name=hazard_instance.get('object_name', 'hazard')), "info"))
             logging.info(f"Hazard {hazard_id} ('{hazard_instance['type']}') moved from {original_room} to {next_room_candidate}.")
@@ -2131,9 +2224,9 @@ class HazardEngine:
         current_room_of_hazard = hazard_instance['location']
         
         # 3a. Collision with Player (if player is in the same room)
-        if self.player['location'] == current_room_of_hazard:
+        if self.player.location == current_room_of_hazard:
             player_collision_rules = hazard_instance['data'].get('collision_effects', {}).get('player', {})
-            if player_collision_rules and random.random() < (player_collision_rules.get('chance', 0.0) + (agg_factor * 0.05)):
+            if player_collision_rules and self.rng.random() < (player_collision_rules.get('chance', 0.0) + (agg_factor * 0.05)):
                 effect_type = player_collision_rules.get('effect')
                 collision_msg_template = player_collision_rules.get("message", "The {object_name} collides with you!")
                 messages_list.append(color_text(collision_msg_template.format(object_name=hazard_instance.get('object_name')), "warning"))
@@ -2154,13 +2247,12 @@ class HazardEngine:
                     return # Game over
 
         # 3b. Collision with other specified targets (e.g., other hazards)
-        defined_collision_targets = hazard_instance['data'].get('collision_targets', [])
-        if "player" in defined_collision_targets: # Player already handled
-            defined_collision_targets.remove("player")
+        # Player already handled; filter rather than remove, the definition is shared and read-only
+        defined_collision_targets = [t for t in hazard_instance['data'].get('collision_targets', []) if t != "player"]
 
-        for other_h_id, other_h_instance in list(self.active_hazards.items()):
+        for other_h_id, other_h_instance in self.hazards_in_room(current_room_of_hazard):
             if self.game_logic.is_game_over: return
-            if other_h_id == hazard_id or other_h_instance['location'] != current_room_of_hazard:
+            if other_h_id == hazard_id:
                 continue
 
             target_type_for_collision_rules = None
@@ -2169,7 +2261,7 @@ class HazardEngine:
 
             if target_type_for_collision_rules:
                 collision_rule_for_type = hazard_instance['data'].get('collision_effects', {}).get(target_type_for_collision_rules)
-                if collision_rule_for_type and random.random() < (collision_rule_for_type.get('chance', 0.0) + (agg_factor * 0.05)):
+                if collision_rule_for_type and self.rng.random() < (collision_rule_for_type.get('chance', 0.0) + (agg_factor * 0.05)):
                     collision_effect = collision_rule_for_type.get('effect')
                     effect_msg_template = collision_rule_for_type.get("message", "The {object_name} bumps {target_object_name}!")
                     messages_list.append(color_text(effect_msg_template.format(
@@ -2186,30 +2278,35 @@ class HazardEngine:
 
     def get_room_hazards_descriptions(self, room_name):
         descriptions = []
-        for hazard_id, hazard_instance in self.active_hazards.items():
-            if hazard_instance.get('location') == room_name:
-                state_data = hazard_instance.get('data', {}).get('states', {}).get(hazard_instance.get('state'))
-                if state_data and state_data.get('description'):
-                    desc_template = state_data['description']
-                    try:
-                        formatted_desc = desc_template.format(
-                            object_name=color_text(hazard_instance.get('object_name', hazard_instance['name']), 'hazard'),
-                            support_object=color_text(hazard_instance.get('support_object', 'its surroundings'), 'room'),
-                            # Add fallback for {object} and any other keys you use in templates
-                            object=color_text(hazard_instance.get('object_name', hazard_instance['name']), 'hazard'),
-                            name=color_text(hazard_instance.get('name', hazard_instance['type']), 'hazard'),
-                        )
-                        if formatted_desc.strip():
-                            descriptions.append(formatted_desc)
-                    except KeyError as e:
-                        logging.error(f"HazardEngine: KeyError in hazard description format for {hazard_instance['type']}/{hazard_instance['state']}: {e}. Template: '{desc_template}'")
-                        descriptions.append(color_text(f"A {hazard_instance.get('name', 'mysterious hazard')} ({hazard_instance.get('object_name','entity')}) is present and active.", "warning"))
+        for hazard_id, hazard_instance in self.hazards_in_room(room_name):
+            state_data = hazard_instance.get('data', {}).get('states', {}).get(hazard_instance.get('state'))
+            if state_data and state_data.get('description'):
+                desc_template = state_data['description']
+                try:
+                    formatted_desc = desc_template.format(
+                        object_name=color_text(hazard_instance.get('object_name', hazard_instance['name']), 'hazard'),
+                        support_object=color_text(hazard_instance.get('support_object', 'its surroundings'), 'room'),
+                        # Add fallback for {object} and any other keys you use in templates
+                        object=color_text(hazard_instance.get('object_name', hazard_instance['name']), 'hazard'),
+                        name=color_text(hazard_instance.get('name', hazard_instance['type']), 'hazard'),
+                    )
+                    if formatted_desc.strip():
+                        descriptions.append(formatted_desc)
+                except KeyError as e:
+                    logging.error(f"HazardEngine: KeyError in hazard description format for {hazard_instance['type']}/{hazard_instance['state']}: {e}. Template: '{desc_template}'")
+                    descriptions.append(color_text(f"A {hazard_instance.get('name', 'mysterious hazard')} ({hazard_instance.get('object_name','entity')}) is present and active.", "warning"))
         return descriptions
     
     def get_room_hazards(self, room_name): # Alias for backward compatibility if used elsewhere
         """Alias for get_room_hazards_descriptions."""
         return self.get_room_hazards_descriptions(room_name)
 
+    def get_room_hazard_signature(self, room_name):
+        """Hashable snapshot of everything get_room_hazards_descriptions(room_name) reads; equal signatures render equal descriptions."""
+        return tuple((hazard_id, hazard_instance.get('type'), hazard_instance.get('state'), hazard_instance.get('name'),
+                      hazard_instance.get('object_name'), hazard_instance.get('support_object'))
+                     for hazard_id, hazard_instance in self.hazards_in_room(room_name))
+
 
     # --- Persistence Methods ---
 
@@ -2220,14 +2317,13 @@ class HazardEngine:
         Returns:
             dict: A dictionary containing the serializable state of the HazardEngine.
         """
-        # Ensure all data within active_hazards and room_env is JSON serializable.
-        # Deepcopy to avoid modifying live state if any transformations are needed here (usually not).
-        # Sets within hazard instances (if any) would need conversion to lists here or before.
-        # Currently, hazard instances seem to use basic types, lists, and dicts.
+        # 'data' is the shared read-only master definition, so it is not saved; load_state re-links it by type.
+        # Shallow copies are enough here: GameLogic._convert_sets_to_lists rebuilds every container before writing.
         return {
-            "active_hazards": copy.deepcopy(self.active_hazards),
-            "room_env": copy.deepcopy(self.room_env),
-            "next_hazard_id": self.next_hazard_id
+            "active_hazards": {hz_id: {k: v for k, v in hz.items() if k != 'data'} for hz_id, hz in self.active_hazards.items()},
+            "room_env": {room_name: dict(env) for room_name, env in self.room_env.items()},
+            "next_hazard_id": self.next_hazard_id,
+            "temporary_room_effects": [dict(effect) for effect in self.temporary_room_effects]
             # processed_hazards_this_turn is transient, no need to save.
         }
 
@@ -2382,7 +2478,7 @@ class HazardEngine:
                                                f"The {hazard_instance.get('object_name','MRI machine')} explodes catastrophically!")
             messages_list.append(color_text(explosion_message, "error"))
             
-            player_is_present = self.player.get('location') == hazard_instance['location']
+            player_is_present = self.player.location == hazard_instance['location']
             # Could also affect adjacent rooms based on explosion_radius_rooms from state_data
             
             if player_is_present:
@@ -2408,7 +2504,7 @@ class HazardEngine:
             messages_list.append(color_text(f"MRI whines... meltdown in {hazard['countdown_turns_remaining']}...", "error"))
         else:
             messages_list.append(color_text(state_data.get("explosion_death_message", "MRI explodes!"), "error"))
-            if self.player.get('location') == hazard['location']:
+            if self.player.location == hazard['location']:
                 self.game_logic.is_game_over = True; self.game_logic.game_won = False
                 self.player['last_hazard_type'] = hazard['type']; self.player['last_hazard_object_name'] = hazard.get('object_name', hazard['type'])
             self._set_hazard_state(hazard_id, state_data.get("next_state", "exploded"), messages_list)
@@ -2427,7 +2523,7 @@ class HazardEngine:
         # Room names are defined as constants in game_data.py
         mri_control_room_name = "MRI Control Room" # Assuming this is the exact name from game_data.rooms
 
-        player_location = self.player.get('location')
+        player_location = self.player.location
 
         if player_location != mri_control_room_name:
             # Player is not in the control room, so they are not directly targeted by this specific action.
@@ -2496,11 +2592,13 @@ class HazardEngine:
             logging.warning("HazardEngine: load_state called with empty or None state_dict.")
             return
 
-        self.active_hazards = copy.deepcopy(state_dict.get("active_hazards", {}))
+        # state_dict comes fresh from json.load, so its containers can be adopted without copying
+        self.active_hazards = state_dict.get("active_hazards", {})
+        self._rebuild_hazard_index()
         
         # For room_env, merge loaded data over the freshly initialized room_env for the level.
         # initialize_for_level should have set up self.room_env with all rooms for the current level.
-        loaded_room_env_data = copy.deepcopy(state_dict.get("room_env", {}))
+        loaded_room_env_data = state_dict.get("room_env", {})
         for room_name, env_data in loaded_room_env_data.items():
             if room_name in self.room_env: # Only update rooms that exist in the current level's setup
                 self.room_env[room_name].update(env_data) # Update existing entries
@@ -2510,18 +2608,22 @@ class HazardEngine:
         self.next_hazard_id = state_dict.get("next_hazard_id", self.next_hazard_id) # Use loaded or current if missing
         
         # Load temporary room effects
-        self.temporary_room_effects = copy.deepcopy(state_dict.get("temporary_room_effects", []))
+        self.temporary_room_effects = state_dict.get("temporary_room_effects", [])
         
         # Ensure room_env reflects active temporary effects upon load
         for effect in self.temporary_room_effects:
             if effect['room'] in self.room_env and effect['key'] in self.room_env[effect['room']]:
                 self.room_env[effect['room']][effect['key']] = effect['temp_value']
         
-        # Ensure all loaded hazard instances have their 'data' field properly linked or copied
-        # (deepcopy in save_state should handle this, but a check could be added if issues arise)
-        # for hz_id, hz_instance in self.active_hazards.items():
-        #    if 'data' not in hz_instance and hz_instance.get('type') in self.hazards_master_data:
-        #        hz_instance['data'] = copy.deepcopy(self.hazards_master_data[hz_instance['type']])
+        # Re-link each hazard's 'data' to the shared master definition (older saves carry a stale copy)
+        for hz_id, hz_instance in self.active_hazards.items():
+            if hz_instance.get('type') in self.hazards_master_data:
+                hz_instance['data'] = freeze_definition(self.hazards_master_data[hz_instance['type']])
+
+        # Count the loaded hazards' environmental effects; the saved room_env already reflects them
+        self.env_contributions.clear(); self.room_env_contributors.clear()
+        for hz_id in self.active_hazards: self._sync_env_contribution(hz_id)
+        self.dirty_env_rooms.clear()
 
         logging.info(f"HazardEngine state loaded. Active hazards: {len(self.active_hazards)}. Temp Effects: {len(self.temporary_room_effects)}. Next ID: {self.next_hazard_id}")
         
\ No newline at end of file
@@ -0,0 +1,38 @@
+import collections
+import logging
+
+# One hazard_interaction rule of a hazard state, as used by HazardEngine._handle_hazard_to_hazard_interactions.
+# required_states is a frozenset of target states the rule needs, or None when any target state will do.
+CompiledHazardInteraction = collections.namedtuple("CompiledHazardInteraction", "target_type required_states chance aggression_influence_on_chance "
+                                                                                "message target_state source_target_state")
+
+
+def compile_hazard_interaction_matrix(hazards_master):
+    """
+    Compiles the 'hazard_interaction' blocks of every hazard state into a matrix:
+    (source type, source state) -> {target type: CompiledHazardInteraction}.
+    States without interactions are left out, so a missing key means the state never reacts with other hazards.
+    """
+    matrix = {}
+    for source_type, definition in (hazards_master or {}).items():
+        if not isinstance(definition, dict): continue
+        for state_name, state_data in (definition.get("states") or {}).items():
+            rules = state_data.get("hazard_interaction") if isinstance(state_data, dict) else None
+            if not rules or not isinstance(rules, dict): continue
+            compiled = {}
+            for target_type, rule in rules.items():
+                if not isinstance(rule, dict): continue
+                required = rule.get("requires_target_hazard_state")
+                if not required: required_states = None
+                elif isinstance(required, (list, tuple)): required_states = frozenset(required)
+                elif isinstance(required, str): required_states = frozenset((required,))
+                else:
+                    logging.warning(f"HazardInteractions: Ignoring unsupported requires_target_hazard_state in {source_type}/{state_name} -> {target_type}.")
+                    required_states = None
+                compiled[target_type] = CompiledHazardInteraction(
+                    target_type=target_type, required_states=required_states, chance=rule.get("chance", 0.5),
+                    aggression_influence_on_chance=rule.get("aggression_influence_on_chance", 0.0),
+                    message=rule.get("message", "The {source_hazard_object} reacts with the {target_hazard_object}!"),
+                    target_state=rule.get("target_state"), source_target_state=rule.get("source_target_state"))
+            if compiled: matrix[(source_type, state_name)] = compiled
+    return matrix
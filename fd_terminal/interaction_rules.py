@@ -0,0 +1,49 @@
+import logging
+from . import game_data
+
+# ==================================
+# Scripted room interactions
+# ==================================
+# A rule is a dict:
+#   {"verb": action, "target": canonical target name, "room": room name (None = any room of the level),
+#    "conditions": [condition dicts], "effects": [effect dicts], "stop": bool}
+# Conditions and effects are {"type": name, ...params}; GameLogic evaluates them with
+# _rule_condition_<type> / _rule_effect_<type>. A condition with "negate": True is inverted.
+# All rules of a (verb, target, room) fire in order when their conditions hold, until a fired rule has "stop".
+
+
+def compile_furniture_rules(level_rooms):
+    """Rules declared on furniture definitions ('on_break_trigger_hazard'), one per room and piece."""
+    rules = []
+    for room_name, room_data in level_rooms.items():
+        if not isinstance(room_data, dict): continue
+        for furniture in room_data.get("furniture", []):
+            trigger = furniture.get("on_break_trigger_hazard")
+            if not furniture.get("name") or not isinstance(trigger, dict): continue
+            rules.append({"verb": game_data.ACTION_BREAK, "target": furniture["name"], "room": room_name,
+                          "conditions": [{"type": "chance", "chance": trigger.get("chance", 1.0)}],
+                          "effects": [{"type": "spawn_hazard", "hazard_type": trigger.get("type"), "initial_state": trigger.get("initial_state"),
+                                       "object_name_override": trigger.get("object_name_override"),
+                                       "support_object_override": trigger.get("support_object_override"),
+                                       "message": f"Breaking {furniture['name']} caused a new problem!"}]})
+    return rules
+
+
+class InteractionRuleIndex:
+    """
+    Interaction rules of one level, indexed by (verb, lowercased target, room). Rules without a
+    room are expanded to every room of the level up front, so a lookup is a single dict hit.
+    """
+
+    def __init__(self, rules, level_rooms):
+        self.rules = {}
+        room_names = list(level_rooms)
+        for rule in list(rules) + compile_furniture_rules(level_rooms):
+            if not rule.get("verb") or not rule.get("target"):
+                logging.warning(f"InteractionRules: Skipping rule without verb/target: {rule}"); continue
+            for room_name in ([rule["room"]] if rule.get("room") else room_names):
+                self.rules.setdefault((rule["verb"], rule["target"].lower(), room_name), []).append(rule)
+
+    def get(self, verb, target, room_name):
+        """Rules for an action on target in room_name, in declaration order."""
+        return self.rules.get((verb, target.lower(), room_name), ()) if target else ()
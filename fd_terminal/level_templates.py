@@ -0,0 +1,140 @@
+import logging
+from .symbols import compile_symbols
+
+ITEM_SOURCE_TYPES = ("items", "evidence", "keys") # Same lookup order as GameLogic; first definition of a name wins
+SIGNATURE_ATTRIBUTES = ITEM_SOURCE_TYPES + ("hazards", "rooms", "FIXED_ITEMS_DYNAMIC_EXCLUSION") # game_data definitions a template is compiled from
+
+
+def is_item_eligible_for_level(item_data, level_id):
+    """True if an item definition belongs to level_id or is global (no level / 'all')."""
+    item_level = item_data.get("level")
+    return item_level == level_id or item_level is None or str(item_level).lower() == "all"
+
+
+def is_item_fixed(item_name, item_data, fixed_exclusions):
+    """True if an item keeps its defined location instead of being placed dynamically."""
+    return bool(item_data.get("fixed_location") or
+                (item_data.get("location") and item_data.get("container")) or # In a defined container
+                (item_data.get("location") and not item_data.get("container") and not item_data.get("is_rare_random_hospital_spawn") and not item_data.get("spawn_locations")) or # On floor
+                item_name in fixed_exclusions)
+
+
+def _normalize_hazard_entry(hazard_entry, room_name, hazards_master, is_possible):
+    """
+    Parses one 'hazards_present' / 'possible_hazards' entry into a flat placement dict,
+    or returns None (with a warning) if the entry can never spawn.
+    """
+    placement = {"room": room_name, "type": None, "is_possible": is_possible, "chance": 0.0 if is_possible else 1.0,
+                 "initial_state": None, "object_name_override": None, "support_object_override": None}
+    if isinstance(hazard_entry, str):
+        placement["type"] = hazard_entry
+        if is_possible and hazard_entry in hazards_master:
+            placement["chance"] = hazards_master[hazard_entry].get("default_spawn_chance", 0.1)
+    elif isinstance(hazard_entry, dict):
+        placement["type"] = hazard_entry.get("type")
+        placement["object_name_override"] = hazard_entry.get("object_name_override")
+        placement["support_object_override"] = hazard_entry.get("support_object_override")
+        placement["initial_state"] = hazard_entry.get("initial_state")
+        if is_possible: placement["chance"] = hazard_entry.get("chance", 0.1)
+    else:
+        logging.warning(f"LevelTemplates: Invalid hazard entry format in room '{room_name}': {hazard_entry}")
+        return None
+    if not placement["type"]:
+        logging.warning(f"LevelTemplates: Hazard entry in room '{room_name}' is missing 'type'. Entry: {hazard_entry}")
+        return None
+    if placement["type"] not in hazards_master:
+        logging.warning(f"LevelTemplates: Hazard type '{placement['type']}' in room '{room_name}' is not defined in master_data. Skipping.")
+        return None
+    return placement
+
+
+def compile_level_template(game_data_module, level_id):
+    """
+    Compiles game_data.rooms[level_id] and its eligible items and hazards into a compact,
+    JSON-serializable template. Only names and placement decisions are stored; the
+    definitions themselves stay in game_data.
+
+    Returns:
+        dict: {"level_id", "items" (name -> game_data source attribute), "initial_placement", "dynamic_items", "fixed_items", "hazard_placements",
+               "symbols" (kind -> names, index = id), "room_exits" (room id -> adjacent room ids)},
+              or None if the level is not defined.
+    """
+    level_rooms = getattr(game_data_module, 'rooms', {}).get(level_id)
+    if level_rooms is None:
+        logging.error(f"LevelTemplates: Level {level_id} data not found in game_data.rooms.")
+        return None
+    fixed_exclusions = set(getattr(game_data_module, 'FIXED_ITEMS_DYNAMIC_EXCLUSION', []))
+    hazards_master = getattr(game_data_module, 'hazards', {}) or {}
+
+    eligible_items = {}; item_sources = {}
+    for source_type in ITEM_SOURCE_TYPES:
+        item_dict = getattr(game_data_module, source_type, {})
+        if not isinstance(item_dict, dict):
+            logging.warning(f"LevelTemplates: Item source '{source_type}' in game_data is not a dictionary. Skipping.")
+            continue
+        for name, data in item_dict.items():
+            if not isinstance(data, dict):
+                logging.warning(f"LevelTemplates: Skipping non-dict item entry in '{source_type}': {name} ({type(data)})")
+                continue
+            if not is_item_eligible_for_level(data, level_id): continue
+            if name in eligible_items:
+                logging.warning(f"LevelTemplates: Duplicate item name '{name}' found. Using first definition.")
+                continue
+            eligible_items[name] = data; item_sources[name] = source_type
+
+    # Initial world state per item: either a fixed/spawn-managed placement, or 'unplaced' for the dynamic pass
+    initial_placement = {}; dynamic_items = {"keys": [], "evidence": [], "other": []}; fixed_items = []
+    for name, data in eligible_items.items():
+        is_fixed = is_item_fixed(name, data, fixed_exclusions)
+        if not is_fixed and not data.get("spawn_locations") and not data.get("is_rare_random_hospital_spawn"):
+            initial_placement[name] = {"unplaced": True, "is_hidden": data.get("is_hidden", True)}
+            category = "keys" if data.get("is_key") else "evidence" if data.get("is_evidence") else "other"
+            dynamic_items[category].append(name)
+        else:
+            initial_placement[name] = {"location": data.get("location"), "container": data.get("container"),
+                                       "is_hidden": data.get("is_hidden", bool(data.get("container")))}
+            if is_fixed: fixed_items.append(name)
+            location = data.get("location")
+            if location and location != "inventory" and location not in level_rooms:
+                logging.warning(f"LevelTemplates: Item '{name}' is fixed to '{location}', which is not a room of level {level_id}.")
+
+    hazard_placements = []
+    for room_name, room_data in level_rooms.items():
+        if not isinstance(room_data, dict):
+            logging.warning(f"LevelTemplates: Room data for '{room_name}' is not a dictionary. Skipping hazard placement.")
+            continue
+        for key, is_possible in (("hazards_present", False), ("possible_hazards", True)):
+            for hazard_entry in room_data.get(key, []):
+                placement = _normalize_hazard_entry(hazard_entry, room_name, hazards_master, is_possible)
+                if placement: hazard_placements.append(placement)
+
+    symbols, room_exits = compile_symbols(level_rooms, item_sources, hazards_master)
+    return {"level_id": level_id, "items": item_sources, "initial_placement": initial_placement,
+            "dynamic_items": dynamic_items, "fixed_items": fixed_items, "hazard_placements": hazard_placements,
+            "symbols": symbols, "room_exits": room_exits}
+
+
+class LevelTemplateCache:
+    """
+    In-memory cache of compiled level templates, one per level id. Compiling a level is cheaper
+    than reading it back from a file, so templates are not persisted. Like the item name registry,
+    the cache is dropped when the definition counts change, as patches (hazard_patch) add
+    definitions at runtime; patches never edit existing definitions in place.
+    """
+
+    def __init__(self, game_data_module):
+        self.game_data = game_data_module
+        self.templates = {}      # level_id -> template
+        self.signature = None    # definition counts the templates were compiled from
+
+    def get(self, level_id):
+        """Returns the compiled template for level_id, compiling it on first use."""
+        signature = tuple(len(getattr(self.game_data, attr, None) or ()) for attr in SIGNATURE_ATTRIBUTES)
+        if signature != self.signature: self.signature = signature; self.templates = {}
+        template = self.templates.get(level_id)
+        if template is None:
+            template = compile_level_template(self.game_data, level_id)
+            if template is None: return None
+            self.templates[level_id] = template
+            logging.info(f"LevelTemplates: Compiled template for level {level_id}: {len(template['items'])} items, {len(template['hazard_placements'])} hazard placements.")
+        return template
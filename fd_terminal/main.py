@@ -97,6 +97,7 @@ class FinalDestinationApp(App):
     # Application-level properties to share data/state between screens if needed
     selected_character_class = None # Stores selected character class from CharacterSelectScreen
     current_disaster_details = None # Stores generated disaster details from IntroScreen
+    session_seed = None             # RNG session seed drawn by IntroScreen, used by GameLogic.start_new_game
     last_game_score = 0             # For displaying on Win/Lose screens
     last_death_reason = "Death's design was fulfilled." # Default death reason
     start_new_session_flag = False # To signal GameScreen to start a fresh GameLogic instance
@@ -0,0 +1,112 @@
+from collections.abc import Mapping, MutableMapping
+
+# Fixed player schema: field -> type. Set fields are stored as lists in save files.
+PLAYER_FIELDS = {
+    "location": str, "current_level": int, "character_class": str,
+    "hp": int, "max_hp": int, "perception": int, "intuition": int,
+    "inventory": list, "status_effects": Mapping, # StatusEffectScheduler (effect name -> turns left); a plain dict before it is attached
+    "score": int, "turns_left": int, "actions_taken": int, "actions_taken_this_level": int,
+    "visited_rooms": set, "visited_rooms_first_text": set,
+    "qte_active": str, "qte_duration": float, "qte_context": dict, "mri_qte_failures": int,
+    "last_hazard_type": str, "last_hazard_object_name": str, "last_death_message": str,
+    "found_evidence_count": int, "evidence_found_this_level": list, "evaded_hazards_current_level": list,
+    "narrative_flags_collected": set, "narrative_snippets_collected": list,
+    "journal": dict, "disaster_context": dict,
+}
+_FIELD_NAMES = frozenset(PLAYER_FIELDS)
+# Types accepted on assignment: ints where floats are declared; sets also as frozensets
+_ACCEPTED_TYPES = {name: (int, float) if field_type is float else (set, frozenset) if field_type is set else field_type
+                   for name, field_type in PLAYER_FIELDS.items()}
+
+
+def _to_json_value(value):
+    if isinstance(value, Mapping): return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)): return [_to_json_value(v) for v in value]
+    if isinstance(value, (set, frozenset)): return sorted(value, key=str)
+    return value
+
+
+class PlayerState(MutableMapping):
+    """
+    Player state with one slot per schema field (no per-instance __dict__). Hot paths read fields
+    as attributes (player.location, player.hp), which is as fast as a dict lookup; the mapping
+    interface (player['hp'], .get) is kept for everything else and goes through Python-level
+    methods, so it is slower. An unset field behaves like a missing key. Keys outside the
+    schema are kept in 'extra'.
+
+    Item assignment (player['hp'] = ...) checks the value against PLAYER_FIELDS and raises
+    TypeError on a mismatch; None is accepted for any field (no value). A PlayerState is always
+    truthy, so 'if self.player' tests for a player rather than counting fields.
+    """
+    __slots__ = tuple(PLAYER_FIELDS) + ("extra",)
+
+    def __init__(self, initial=None, **fields):
+        self.extra = {}
+        if initial: self.update(initial)
+        if fields: self.update(fields)
+
+    def __getitem__(self, key):
+        if key in _FIELD_NAMES:
+            try: return getattr(self, key)
+            except AttributeError: raise KeyError(key) from None
+        return self.extra[key]
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_NAMES:
+            if value is not None and not isinstance(value, _ACCEPTED_TYPES[key]):
+                raise TypeError(f"PlayerState.{key} must be {PLAYER_FIELDS[key].__name__}, got {type(value).__name__}: {value!r}")
+            setattr(self, key, value)
+        else: self.extra[key] = value
+
+    def __delitem__(self, key):
+        if key in _FIELD_NAMES:
+            try: delattr(self, key)
+            except AttributeError: raise KeyError(key) from None
+        else: del self.extra[key]
+
+    def __contains__(self, key):
+        if key in _FIELD_NAMES: return hasattr(self, key)
+        return key in self.extra
+
+    def __iter__(self):
+        for name in PLAYER_FIELDS:
+            if hasattr(self, name): yield name
+        yield from self.extra
+
+    def __len__(self):
+        return sum(1 for name in PLAYER_FIELDS if hasattr(self, name)) + len(self.extra)
+
+    def __bool__(self): return True
+
+    def get(self, key, default=None):
+        if key in _FIELD_NAMES: return getattr(self, key, default)
+        return self.extra.get(key, default)
+
+    def setdefault(self, key, default=None):
+        if key in _FIELD_NAMES:
+            if not hasattr(self, key): self[key] = default
+            return getattr(self, key)
+        return self.extra.setdefault(key, default)
+
+    def __repr__(self): return f"PlayerState({dict(self)!r})"
+
+    def to_save_dict(self):
+        """JSON-ready dict: schema fields by their declared type (sets as sorted lists), then the extra keys."""
+        data = {}
+        for name, field_type in PLAYER_FIELDS.items():
+            if not hasattr(self, name): continue
+            value = getattr(self, name)
+            if field_type is set and isinstance(value, (set, frozenset, list, tuple)): value = sorted(value, key=str)
+            elif field_type in (list, dict) or not isinstance(value, (str, int, float, bool, type(None))): value = _to_json_value(value)
+            data[name] = value
+        for key, value in self.extra.items(): data[key] = _to_json_value(value)
+        return data
+
+    @classmethod
+    def from_save_dict(cls, data):
+        """Inverse of to_save_dict: restores set fields from their saved lists."""
+        player = cls()
+        for key, value in data.items():
+            if PLAYER_FIELDS.get(key) is set and isinstance(value, (list, tuple)): value = set(value)
+            player[key] = value
+        return player
@@ -0,0 +1,129 @@
+import functools
+import json
+import time
+
+# Histogram bucket i counts timings below 2**i microseconds; the last bucket is open-ended.
+HISTOGRAM_BUCKETS = 16
+
+
+class PhaseStats:
+    """Count, total, max and a log2 microsecond histogram of one phase's timings."""
+    __slots__ = ("count", "total_ns", "max_ns", "histogram")
+
+    def __init__(self):
+        self.count = 0; self.total_ns = 0; self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, elapsed_ns):
+        self.count += 1; self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns: self.max_ns = elapsed_ns
+        self.histogram[min((elapsed_ns // 1000).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def to_dict(self):
+        return {"count": self.count, "total_ms": self.total_ns / 1e6, "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+                "max_us": self.max_ns / 1e3, "histogram_us": {f"<{2 ** i}" if i < HISTOGRAM_BUCKETS - 1 else f">={2 ** (i - 1)}": n
+                                                            for i, n in enumerate(self.histogram) if n}}
+
+
+class _PhaseTimer:
+    __slots__ = ("stats", "started")
+
+    def __init__(self, stats): self.stats = stats
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns(); return self
+
+    def __exit__(self, *exc_info):
+        self.stats.add(time.perf_counter_ns() - self.started); return False
+
+
+class _StepTimer:
+    """Times consecutive loop iterations: each next(label) closes the previous step and starts a new one."""
+    __slots__ = ("profiler", "phase", "label", "started")
+
+    def __init__(self, profiler, phase):
+        self.profiler = profiler; self.phase = phase; self.label = None; self.started = None
+
+    def next(self, label):
+        now = time.perf_counter_ns()
+        if self.started is not None: self.profiler.stats(self.phase, self.label).add(now - self.started)
+        self.label = label; self.started = now
+
+    def close(self):
+        if self.started is not None: self.profiler.stats(self.phase, self.label).add(time.perf_counter_ns() - self.started)
+        self.started = None
+
+
+class _NullTimer:
+    """Stand-in returned while profiling is off, so call sites need no enabled checks."""
+    __slots__ = ()
+    def __enter__(self): return self
+    def __exit__(self, *exc_info): return False
+    def next(self, label): pass
+    def close(self): pass
+
+_NULL_TIMER = _NullTimer()
+
+
+class TurnProfiler:
+    """
+    Low-overhead phase timers for the turn pipeline (pre-action status, command handler,
+    action hazards, hazard update, environment, status ticks, description rendering).
+    Off by default; while off, phase() and steps() return a shared no-op timer.
+
+    Phases nest (e.g. 'hazards.environment' runs inside 'hazards.update'), and each phase
+    records its inclusive time. Per-item breakdowns, such as per hazard type, are kept under
+    the phase's labels.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self):
+        self.phases = {}   # phase name -> PhaseStats
+        self.labels = {}   # phase name -> label (e.g. hazard type) -> PhaseStats
+
+    def stats(self, phase, label=None):
+        if label is None:
+            stats = self.phases.get(phase)
+            if stats is None: stats = self.phases[phase] = PhaseStats()
+            return stats
+        by_label = self.labels.setdefault(phase, {})
+        stats = by_label.get(label)
+        if stats is None: stats = by_label[label] = PhaseStats()
+        return stats
+
+    def phase(self, name):
+        """Context manager timing one phase: `with profiler.phase('command'): ...`."""
+        return _PhaseTimer(self.stats(name)) if self.enabled else _NULL_TIMER
+
+    def steps(self, phase):
+        """Step timer for a loop whose iterations are attributed to labels; call close() after the loop."""
+        return _StepTimer(self, phase) if self.enabled else _NULL_TIMER
+
+    def snapshot(self):
+        return {"enabled": self.enabled,
+                "phases": {name: stats.to_dict() for name, stats in self.phases.items()},
+                "breakdown": {phase: {label: stats.to_dict() for label, stats in by_label.items()} for phase, by_label in self.labels.items()}}
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def summary_lines(self, limit=8):
+        """Phases by total time, one short line each, for the debug overlay."""
+        ranked = sorted(self.phases.items(), key=lambda entry: entry[1].total_ns, reverse=True)[:limit]
+        return [f"{name}: {stats.total_ns / 1e6:.1f}ms / {stats.count} (avg {stats.total_ns / stats.count / 1e3:.0f}us, max {stats.max_ns / 1e3:.0f}us)"
+                for name, stats in ranked if stats.count]
+
+
+def profiled_phase(phase_name):
+    """Times a method as a profiler phase. The instance provides the TurnProfiler as self.profiler."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if not profiler.enabled: return method(self, *args, **kwargs)
+            with _PhaseTimer(profiler.stats(phase_name)): return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
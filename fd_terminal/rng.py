@@ -0,0 +1,41 @@
+import hashlib
+import random
+
+# Independent random streams per subsystem. Drawing more numbers in one subsystem never shifts
+# the sequence another one sees, so e.g. a hazard tweak leaves item placement reproducible.
+RNG_STREAMS = ("placement", "hazards", "qte", "narrative")
+
+
+def derive_stream_seed(session_seed, stream_name):
+    """Stable 64-bit seed for one stream of a session (independent of PYTHONHASHSEED)."""
+    return int.from_bytes(hashlib.sha256(f"{session_seed}:{stream_name}".encode("utf-8")).digest()[:8], "big")
+
+
+class RandomStreams:
+    """
+    One random.Random per subsystem (self.placement, self.hazards, self.qte, self.narrative),
+    all derived from a single session seed. Without an explicit seed one is drawn from the
+    global random module, so random.seed() still makes a whole session reproducible.
+    """
+
+    def __init__(self, session_seed=None):
+        self.session_seed = session_seed if session_seed is not None else random.getrandbits(63)
+        for stream_name in RNG_STREAMS:
+            setattr(self, stream_name, random.Random(derive_stream_seed(self.session_seed, stream_name)))
+
+    def to_save_dict(self):
+        """Session seed plus each stream's current position, as JSON-ready lists."""
+        states = {}
+        for stream_name in RNG_STREAMS:
+            version, internal_state, gauss_next = getattr(self, stream_name).getstate()
+            states[stream_name] = [version, list(internal_state), gauss_next]
+        return {"session_seed": self.session_seed, "states": states}
+
+    @classmethod
+    def from_save_dict(cls, data):
+        """Restores the streams saved by to_save_dict; streams missing from the save restart from the seed."""
+        streams = cls(data.get("session_seed"))
+        for stream_name, state in (data.get("states") or {}).items():
+            if stream_name in RNG_STREAMS and isinstance(state, list) and len(state) == 3:
+                getattr(streams, stream_name).setstate((state[0], tuple(state[1]), state[2]))
+        return streams
@@ -0,0 +1,146 @@
+import collections
+
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    Moves to one target room (the player's) from every room of the level, and the next room to step
+    into, from a single reverse BFS. Read by every hazard heading for the player in the same turn.
+    """
+    __slots__ = ("target_id", "room_ids", "room_names", "distance", "next_hop")
+
+    def __init__(self, target_id, room_ids, room_names, distance, next_hop):
+        self.target_id = target_id; self.room_ids = room_ids; self.room_names = room_names
+        self.distance = distance          # room id -> moves to the target, or UNREACHABLE
+        self.next_hop = next_hop          # room id -> room id to step into, or UNREACHABLE (also for the target itself)
+
+    def moves_from(self, room_name):
+        """Moves from room_name to the target, or None if it cannot be reached."""
+        room_id = self.room_ids.get(room_name)
+        if room_id is None or self.distance[room_id] == UNREACHABLE: return None
+        return self.distance[room_id]
+
+    def moves_from_id(self, room_id):
+        """moves_from() for a room id of the level's SymbolTable."""
+        moves = self.distance[room_id]
+        return None if moves == UNREACHABLE else moves
+
+    def next_step(self, room_name):
+        """The room to step into from room_name towards the target, or None."""
+        room_id = self.room_ids.get(room_name)
+        if room_id is None or self.next_hop[room_id] == UNREACHABLE: return None
+        return self.room_names[self.next_hop[room_id]]
+
+
+class RoomGraph:
+    """
+    All-pairs shortest-path tables for the rooms of one level, over the integer room ids and
+    adjacency of its SymbolTable. A path may only pass through rooms that are present and unlocked;
+    the start and end rooms themselves may be locked (a hazard can leave a locked room, and the
+    player's room is a valid goal even behind a locked door).
+
+    The tables are built on first use and kept until a room's lock changes (set_locked) or
+    invalidate() is called, so pathing between two rooms is a table lookup. flow_field() serves
+    the common single-target case (hazards seeking the player) without the all-pairs tables.
+    """
+
+    def __init__(self, symbols, rooms):
+        self.symbols = symbols
+        self.rooms = rooms                # GameLogic.current_level_rooms; 'locked' is read when the tables are built
+        self.room_names = symbols.names["room"]
+        self.room_exits = symbols.room_exits
+        self.room_entries = [[] for _ in self.room_names] # room id -> ids of the rooms with an exit into it
+        for room_id, exits in enumerate(self.room_exits):
+            for next_id in exits: self.room_entries[next_id].append(room_id)
+        self.passable = None              # room id -> True if paths may pass through the room
+        self.next_hop = None              # start id -> end id -> first room id on the path, or UNREACHABLE
+        self.distance = None              # start id -> end id -> number of moves, or UNREACHABLE
+        self._flow_field = None           # FlowField of the last target asked for
+
+    def invalidate(self):
+        self.passable = self.next_hop = self.distance = self._flow_field = None
+
+    def set_locked(self, room_name, locked):
+        """Records a lock change; the tables are only dropped if the room's passability actually changed."""
+        room_id = self.symbols.id("room", room_name)
+        if room_id is None or self.passable is None: return
+        if self.passable[room_id] != (not locked and bool(self.rooms.get(room_name))): self.invalidate()
+
+    def _build_passable(self):
+        self.passable = [bool(self.rooms.get(name)) and not self.rooms[name].get('locked', False) for name in self.room_names]
+
+    def _build(self):
+        room_count = len(self.room_names)
+        if self.passable is None: self._build_passable()
+        self.next_hop = [None] * room_count; self.distance = [None] * room_count
+        for start_id in range(room_count):
+            # BFS in exit order; a room's first hop is inherited from the room it was first reached from
+            first_hop = [UNREACHABLE] * room_count; distance = [UNREACHABLE] * room_count
+            distance[start_id] = 0; first_hop[start_id] = start_id
+            queue = collections.deque([start_id])
+            while queue:
+                current_id = queue.popleft()
+                for next_id in self.room_exits[current_id]:
+                    if distance[next_id] != UNREACHABLE: continue
+                    distance[next_id] = distance[current_id] + 1
+                    first_hop[next_id] = next_id if current_id == start_id else first_hop[current_id]
+                    if self.passable[next_id]: queue.append(next_id)
+            self.next_hop[start_id] = first_hop; self.distance[start_id] = distance
+
+    def _ids(self, start_room, end_room):
+        start_id = self.symbols.id("room", start_room); end_id = self.symbols.id("room", end_room)
+        if start_id is None or end_id is None or start_room not in self.rooms: return None, None
+        if self.next_hop is None: self._build()
+        return start_id, end_id
+
+    def next_step(self, start_room, end_room):
+        """The room to move to from start_room towards end_room, or None if end_room is unreachable."""
+        start_id, end_id = self._ids(start_room, end_room)
+        if start_id is None or start_id == end_id: return None
+        hop = self.next_hop[start_id][end_id]
+        return self.room_names[hop] if hop != UNREACHABLE else None
+
+    def moves_between(self, start_room, end_room):
+        """Number of moves from start_room to end_room, or None if end_room is unreachable."""
+        start_id, end_id = self._ids(start_room, end_room)
+        if start_id is None: return None
+        moves = self.distance[start_id][end_id]
+        return moves if moves != UNREACHABLE else None
+
+    def path(self, start_room, end_room):
+        """Shortest path as a list of room names (start and end included), or None."""
+        start_id, end_id = self._ids(start_room, end_room)
+        if start_id is None or self.distance[start_id][end_id] == UNREACHABLE: return None
+        path_ids = [start_id]
+        while path_ids[-1] != end_id: path_ids.append(self.next_hop[path_ids[-1]][end_id])
+        return [self.room_names[room_id] for room_id in path_ids]
+
+    def flow_field(self, target_room):
+        """
+        FlowField towards target_room, or None if it is not a room of the level. Kept until the
+        target changes (the player moved) or a lock changes.
+        """
+        target_id = self.symbols.id("room", target_room)
+        if target_id is None: return None
+        if self._flow_field is not None and self._flow_field.target_id == target_id: return self._flow_field
+        if self.passable is None: self._build_passable()
+        room_count = len(self.room_names)
+        distance = [UNREACHABLE] * room_count; distance[target_id] = 0
+        queue = collections.deque([target_id])
+        while queue:
+            current_id = queue.popleft()
+            if current_id != target_id and not self.passable[current_id]: continue # Reached, but paths may not pass through it
+            for previous_id in self.room_entries[current_id]:
+                if distance[previous_id] == UNREACHABLE:
+                    distance[previous_id] = distance[current_id] + 1; queue.append(previous_id)
+        # Same step as the forward search picks: the first exit, in exit order, that is on a shortest path
+        next_hop = [UNREACHABLE] * room_count
+        for room_id in range(room_count):
+            moves = distance[room_id]
+            if moves <= 0 or self.room_names[room_id] not in self.rooms: continue
+            for next_id in self.room_exits[room_id]:
+                if next_id == target_id or (self.passable[next_id] and distance[next_id] == moves - 1):
+                    next_hop[room_id] = next_id; break
+        self._flow_field = FlowField(target_id, self.symbols.ids["room"], self.room_names, distance, next_hop)
+        return self._flow_field
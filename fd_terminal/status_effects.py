@@ -0,0 +1,84 @@
+import collections
+import heapq
+import itertools
+import logging
+from collections.abc import Mapping
+
+# A status effect definition from game_data.status_effects_definitions, flattened once at startup
+CompiledStatusEffect = collections.namedtuple("CompiledStatusEffect", "name duration hp_change_per_turn prevents_action action_failure_chance "
+                                                                      "message_on_apply message_on_tick message_on_wear_off message_on_action_attempt ticks")
+
+
+def compile_status_effects(definitions):
+    """Compiles status effect definitions into CompiledStatusEffect tuples keyed by effect name."""
+    compiled = {}
+    for name, effect_def in (definitions or {}).items():
+        if not isinstance(effect_def, dict):
+            logging.warning(f"StatusEffects: Definition for '{name}' is not a dictionary. Skipping."); continue
+        hp_change = effect_def.get("hp_change_per_turn", 0); tick_message = effect_def.get("message_on_tick")
+        compiled[name] = CompiledStatusEffect(
+            name=name, duration=effect_def.get("duration", 1), hp_change_per_turn=hp_change,
+            prevents_action=bool(effect_def.get("prevents_action")),
+            action_failure_chance=(effect_def.get("effects") or {}).get("action_failure_chance", 0.0),
+            message_on_apply=effect_def.get("message_on_apply", f"Now {name}."), message_on_tick=tick_message,
+            message_on_wear_off=effect_def.get("message_on_wear_off"),
+            message_on_action_attempt=effect_def.get("message_on_action_attempt"),
+            ticks=bool(tick_message or hp_change))
+    return compiled
+
+
+class StatusEffectScheduler(Mapping):
+    """
+    The player's active status effects, as a read-only mapping of effect name -> turns left
+    (which is also how they are saved). Expiries sit in a heap keyed by the scheduler's own
+    turn counter, and only effects with a per-turn message or hp change are visited every tick.
+
+    Re-applying an active effect refreshes it: its remaining duration is replaced by the new one
+    and it keeps its place in the tick order. Stale heap entries left by refreshes are skipped.
+    """
+
+    def __init__(self, definitions, active=None):
+        self.definitions = definitions
+        self.turn = 0
+        self.expiry = {}        # effect name -> turn it wears off at; insertion order = application order
+        self.ticking = {}       # effect name -> CompiledStatusEffect, for effects with per-turn callbacks
+        self._heap = []         # (expiry turn, sequence, effect name)
+        self._sequence = itertools.count()
+        for name, turns_left in (active or {}).items():
+            if name in definitions: self.apply(name, turns_left)
+            else: logging.warning(f"StatusEffects: Dropping unknown saved effect '{name}'.")
+
+    def __getitem__(self, name): return self.expiry[name] - self.turn
+    def __iter__(self): return iter(self.expiry)
+    def __len__(self): return len(self.expiry)
+    def __contains__(self, name): return name in self.expiry
+
+    def apply(self, name, duration):
+        effect = self.definitions[name]
+        self.expiry[name] = self.turn + duration
+        if effect.ticks: self.ticking[name] = effect
+        heapq.heappush(self._heap, (self.expiry[name], next(self._sequence), name))
+
+    def remove(self, name):
+        self.expiry.pop(name, None); self.ticking.pop(name, None) # Its heap entry goes stale
+
+    def active_effects(self):
+        return [self.definitions[name] for name in self.expiry]
+
+    def tick(self):
+        """
+        Advances one turn. Returns [(CompiledStatusEffect, expired)] in application order: every
+        effect with a per-turn callback, plus any other effect that wore off this turn.
+        """
+        fired = list(self.ticking.values())
+        self.turn += 1
+        expired = set()
+        while self._heap and self._heap[0][0] <= self.turn:
+            expiry_turn, _, name = heapq.heappop(self._heap)
+            if self.expiry.get(name) == expiry_turn: expired.add(name)
+        if not expired: return [(effect, False) for effect in fired]
+        fired_names = {effect.name for effect in fired}
+        events = [(effect, effect.name in expired) for effect in fired]
+        events += [(self.definitions[name], True) for name in self.expiry if name in expired and name not in fired_names]
+        for name in expired: self.remove(name)
+        return events
@@ -0,0 +1,53 @@
+import sys
+
+SYMBOL_KINDS = ("room", "item", "hazard_type", "hazard_state")
+
+
+class SymbolTable:
+    """
+    Dense integer ids for the names of one level: rooms, items, hazard types and hazard states.
+    Ids are list indexes (0..n-1 per kind), so per-symbol state can live in plain lists or
+    int-keyed indexes instead of string-keyed dicts (see room_graph.py and HazardEngine's hazard
+    and environment indexes). Names are interned; convert back with name() only where text is shown.
+    """
+
+    def __init__(self, symbols=None, room_exits=None):
+        symbols = symbols or {}
+        self.names = {kind: [sys.intern(name) for name in symbols.get(kind, [])] for kind in SYMBOL_KINDS}
+        self.ids = {kind: {name: symbol_id for symbol_id, name in enumerate(names)} for kind, names in self.names.items()}
+        self.casefolded = {kind: {} for kind in SYMBOL_KINDS}
+        for kind, names in self.names.items():
+            for symbol_id, name in enumerate(names): self.casefolded[kind].setdefault(name.lower(), symbol_id)
+        # room id -> tuple of adjacent room ids, in the room's exit order
+        self.room_exits = [tuple(exits) for exits in (room_exits or [])]
+
+    def id(self, kind, name, default=None):
+        return self.ids[kind].get(name, default)
+
+    def name(self, kind, symbol_id):
+        return self.names[kind][symbol_id]
+
+    def resolve(self, kind, text):
+        """Id of the symbol called text, ignoring case, or None."""
+        return self.casefolded[kind].get(text.lower()) if text else None
+
+    def count(self, kind):
+        return len(self.names[kind])
+
+
+def compile_symbols(level_rooms, item_names, hazards_master):
+    """
+    Symbol lists (index = id) and the room adjacency of a level, as stored in its compiled template.
+    Exits leading out of the level are left out of the adjacency.
+    """
+    room_names = list(level_rooms)
+    room_ids = {name: symbol_id for symbol_id, name in enumerate(room_names)}
+    room_exits = []
+    for room_name in room_names:
+        room_data = level_rooms[room_name]
+        exits = room_data.get("exits", {}) if isinstance(room_data, dict) else {}
+        room_exits.append([room_ids[dest] for dest in exits.values() if dest in room_ids])
+    hazard_states = sorted({state for definition in hazards_master.values() if isinstance(definition, dict)
+                            for state in (definition.get("states") or {})})
+    symbols = {"room": room_names, "item": list(item_names), "hazard_type": sorted(hazards_master), "hazard_state": hazard_states}
+    return symbols, room_exits
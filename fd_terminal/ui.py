@@ -31,11 +31,12 @@ from .game_logic import GameLogic
 from . import game_data
 from .utils import color_text, COLOR_RED, COLOR_GREEN, COLOR_YELLOW, COLOR_CYAN, COLOR_ORANGE, COLOR_LIGHT_GREY, COLOR_BLUE, COLOR_PURPLE, COLOR_WHITE, COLOR_MAGENTA # utils.py provides color constants
 from .achievements import AchievementsSystem 
+from .rng import RandomStreams
 
 import os
 import logging # Standard logging
 import datetime # Used in JournalScreen
-import random # For IntroScreen and random font selection
+import random # For random font selection
 import json   # For save/load operations (though mostly handled by GameLogic)
 import sys    # For resource_path
 import glob   # For random font selection
@@ -645,7 +646,10 @@ class IntroScreen(BaseScreen):
             app_instance.current_disaster_details = None
             return
 
-        chosen_disaster_key = random.choice(list(gd.disasters.keys()))
+        # The intro starts the session: its seed is handed to GameLogic.start_new_game by the GameScreen
+        session_rng = RandomStreams(); app_instance.session_seed = session_rng.session_seed
+        rng = session_rng.narrative
+        chosen_disaster_key = rng.choice(list(gd.disasters.keys()))
         disaster_info = gd.disasters[chosen_disaster_key]
         
         chosen_visionary = "a mysterious figure" 
@@ -702,8 +706,8 @@ class IntroScreen(BaseScreen):
             elif "wildfire" in chosen_disaster_key.lower() or "forest" in chosen_disaster_key.lower():
                  possible_visionary_categories.extend(visionary_category_map.get("natural_disaster", []) + visionary_category_map.get("outdoor_locations", []))
         
-        unique_possible_visionary_cats = list(set(possible_visionary_categories))
-        random.shuffle(unique_possible_visionary_cats) 
+        unique_possible_visionary_cats = list(dict.fromkeys(possible_visionary_categories)) # Ordered, so a seed replays the same pick
+        rng.shuffle(unique_possible_visionary_cats) 
 
         selected_visionaries_list = None
         # Ensure CATEGORIZED_VISIONARIES is correctly accessed from gd (game_data module)
@@ -714,23 +718,23 @@ class IntroScreen(BaseScreen):
                     break 
             if not selected_visionaries_list:
                 fallback_cats = ["strangers_distinctive", "bystanders_general", "children_youths"]
-                random.shuffle(fallback_cats)
+                rng.shuffle(fallback_cats)
                 for fb_cat in fallback_cats:
                     if fb_cat in gd.CATEGORIZED_VISIONARIES and gd.CATEGORIZED_VISIONARIES[fb_cat]:
                         selected_visionaries_list = gd.CATEGORIZED_VISIONARIES[fb_cat]
                         break
             if selected_visionaries_list:
-                chosen_visionary = random.choice(selected_visionaries_list)
+                chosen_visionary = rng.choice(selected_visionaries_list)
         else:
             logging.warning("game_data.CATEGORIZED_VISIONARIES not found. Using default visionary.")
         
         warnings = disaster_info.get("warnings", ["Watch out!"])
-        warning = random.choice(warnings) if warnings else "Watch out!"
+        warning = rng.choice(warnings) if warnings else "Watch out!"
         
         killed_count_val = disaster_info.get("killed_count", 0)
         if callable(killed_count_val): killed_count_val = killed_count_val()
         elif isinstance(killed_count_val, tuple) and len(killed_count_val) == 2: 
-            killed_count_val = random.randint(killed_count_val[0], killed_count_val[1])
+            killed_count_val = rng.randint(killed_count_val[0], killed_count_val[1])
         
         # --- INTEGRATED MODIFIED FATE SELECTION LOGIC ---
         survivor_fate_list = getattr(gd, 'survivor_fates', ["drowned", "crushed", "disappeared"]) # Default if not found
@@ -753,10 +757,10 @@ class IntroScreen(BaseScreen):
             if min_fates_to_show > upper_bound_for_random : #This can happen if available_fates_count is < min_fates_to_show but > 0
                 num_fates_to_select = upper_bound_for_random
             else:
-                num_fates_to_select = random.randint(min_fates_to_show, upper_bound_for_random)
+                num_fates_to_select = rng.randint(min_fates_to_show, upper_bound_for_random)
 
         if num_fates_to_select > 0:
-            selected_fates = random.sample(survivor_fate_list, num_fates_to_select)
+            selected_fates = rng.sample(survivor_fate_list, num_fates_to_select)
             
             if len(selected_fates) == 1:
                 formatted_fates = selected_fates[0]
@@ -765,7 +769,7 @@ class IntroScreen(BaseScreen):
             else: # 3 or more
                 formatted_fates = ", ".join(selected_fates[:-1]) + f", and {selected_fates[-1]}"
         elif available_fates_count > 0 : # If num_fates_to_select ended up 0 but fates were available (edge case)
-             selected_fates = random.sample(survivor_fate_list, 1) # pick at least one
+             selected_fates = rng.sample(survivor_fate_list, 1) # pick at least one
              formatted_fates = selected_fates[0]
         else: # No fates available and num_fates_to_select is 0
             formatted_fates = "met unknown fates"
@@ -1155,10 +1159,27 @@ class GameScreen(BaseScreen):
         # Text Input Field
         self.input_field = TextInput(
             hint_text="Or type command here...", multiline=False, size_hint_y=None, height=dp(40),
-            font_name=DEFAULT_FONT_REGULAR_NAME, font_size=dp(14), padding=[dp(6), dp(6), dp(6), dp(6)]
+            font_name=DEFAULT_FONT_REGULAR_NAME, font_size=dp(14), padding=[dp(6), dp(6), dp(6), dp(6)], write_tab=False
         )
         self.input_field.bind(on_text_validate=self.process_input_from_text_field)
+        self.input_field.bind(text=self.on_input_text_changed)
         left_panel.add_widget(self.input_field)
+        # Autocomplete suggestions for the input field (Tab accepts the first one)
+        self.current_completions = []
+        self.completion_label = Label(
+            text="", markup=True, font_name=DEFAULT_FONT_REGULAR_NAME, font_size=dp(12),
+            size_hint_y=None, height=dp(20), halign='left', valign='middle', shorten=True
+        )
+        self.completion_label.bind(size=lambda instance, value: setattr(instance, 'text_size', (instance.width, None)))
+        left_panel.add_widget(self.completion_label)
+        # Turn profiler overlay, hidden until F12 switches profiling on (Shift+F12 dumps it as JSON)
+        self.profiler_overlay_label = Label(
+            text="", markup=True, font_name=DEFAULT_FONT_REGULAR_NAME, font_size=dp(11),
+            size_hint_y=None, height=0, opacity=0, halign='left', valign='top'
+        )
+        self.profiler_overlay_label.bind(size=lambda instance, value: setattr(instance, 'text_size', (instance.width, None)))
+        left_panel.add_widget(self.profiler_overlay_label)
+        Window.bind(on_key_down=self._on_input_key_down)
         main_split_layout.add_widget(left_panel)
 
         # --- RIGHT PANEL ---
@@ -1180,6 +1201,13 @@ class GameScreen(BaseScreen):
             label_widget.bind(size=lambda instance, value: setattr(instance, 'text_size', (instance.width, None)))
             status_layout.add_widget(label_widget)
         right_panel.add_widget(status_layout)
+        # Nearest hazard the character can sense (own room; a few rooms out with high intuition)
+        self.hazard_warning_label = Label(
+            text="", markup=True, font_name=DEFAULT_FONT_REGULAR_NAME, font_size=dp(13),
+            size_hint_y=None, height=dp(20), halign='left', valign='middle', shorten=True
+        )
+        self.hazard_warning_label.bind(size=lambda instance, value: setattr(instance, 'text_size', (instance.width, None)))
+        right_panel.add_widget(self.hazard_warning_label)
         self.output_label = Label(
             text="Initializing game...\n", markup=True, font_name=DEFAULT_FONT_REGULAR_NAME,
             font_size=dp(15), size_hint_y=None, valign='top', halign='left', padding=(dp(8), dp(8))
@@ -1220,7 +1248,7 @@ class GameScreen(BaseScreen):
             char_class = getattr(app, 'selected_character_class', "Journalist")
             
             self.game_logic = GameLogic(achievements_system=self.achievements_system)
-            self.game_logic.start_new_game(character_class=char_class)
+            self.game_logic.start_new_game(character_class=char_class, session_seed=getattr(app, 'session_seed', None))
             
             if hasattr(app, 'current_disaster_details') and app.current_disaster_details:
                 self.game_logic.player['disaster_context'] = app.current_disaster_details
@@ -1322,10 +1350,22 @@ class GameScreen(BaseScreen):
         score_val = self.game_logic.player.get('score', 0)
         self.score_label.text = f"Score: {color_text(str(score_val), COLOR_PURPLE)}"
         
+        self.hazard_warning_label.text = self.game_logic.get_hazard_warning()
+
         self.update_map_display()
         self.update_inventory_display()
+        self.update_profiler_overlay()
         logging.debug("All UI elements updated.")
 
+    def update_profiler_overlay(self):
+        profiler = self.game_logic.profiler if self.game_logic else None
+        if not profiler or not profiler.enabled:
+            self.profiler_overlay_label.text = ""; self.profiler_overlay_label.height = 0; self.profiler_overlay_label.opacity = 0
+            return
+        lines = profiler.summary_lines(limit=8) or ["No turns timed yet."]
+        self.profiler_overlay_label.text = color_text("Turn profile (F12 off, Shift+F12 dump)", 'special') + "\n" + "\n".join(lines)
+        self.profiler_overlay_label.height = dp(14) * (len(lines) + 1); self.profiler_overlay_label.opacity = 1
+
     def update_map_display(self):
         if self.game_logic and self.game_logic.player:
             map_area_width_pixels = self.map_scroll.width - dp(10) 
@@ -1343,12 +1383,8 @@ class GameScreen(BaseScreen):
             if inventory_list:
                 colored_items = []
                 for item_name in inventory_list:
-                    item_master_data = self.game_logic._get_item_data(item_name)
-                    item_color_name = 'item'  # Default green
-                    if item_master_data and item_master_data.get('is_evidence'):
-                        item_color_name = 'evidence'  # Orange
-                    elif item_master_data and item_master_data.get('is_key'):
-                        item_color_name = 'special'  # Purple for keys
+                    # 'evidence' = orange, 'special' = purple for keys, 'item' = green; maintained incrementally by GameLogic
+                    item_color_name = self.game_logic.get_inventory_display_category(item_name)
                     colored_items.append(color_text(item_name.capitalize(), item_color_name))
                 self.inventory_content_label.text = ", ".join(colored_items)
             else:
@@ -1565,6 +1601,30 @@ class GameScreen(BaseScreen):
                 self.process_command(command)
         instance.text = ""  # Clear input field
 
+    def on_input_text_changed(self, instance, text):
+        """Refreshes the autocomplete suggestions as the player types."""
+        if not text.strip() or self.active_qte_type or self.active_qte_popup or not self.game_logic.player:
+            self.current_completions = []
+        else:
+            self.current_completions = [c for c in self.game_logic.get_command_completions(text, limit=5) if c.lower() != text.strip().lower()]
+        self.completion_label.text = color_text("  |  ".join(self.current_completions), 'command') if self.current_completions else ""
+
+    def _on_input_key_down(self, window, key, scancode, codepoint, modifiers):
+        """Tab in the focused input field accepts the first autocomplete suggestion; F12 toggles the turn profiler."""
+        if key == 293 and self.game_logic: # F12
+            if 'shift' in modifiers:
+                dump_path = self.game_logic.dump_profile()
+                if dump_path: self._append_to_output(color_text(f"Turn profile written to {dump_path}", 'special'))
+            else:
+                self.game_logic.profiler.enabled = not self.game_logic.profiler.enabled
+                self.update_profiler_overlay()
+            return True
+        if key != 9 or not self.input_field.focus or not self.current_completions: return False
+        completion = self.current_completions[0]
+        self.input_field.text = completion if " " in completion else completion + " " # Bare verbs get a space for the target
+        self.input_field.cursor = (len(self.input_field.text), 0)
+        return True
+
     def process_command(self, command_str):
         """Central method to process any command, update UI, and check game state."""
         if not self.game_logic or not self.game_logic.player:
@@ -1681,8 +1741,8 @@ class GameScreen(BaseScreen):
         self._append_to_output(transition_data.get("message", "Transitioning to a new area..."))
         
         # Display new room description
-        if self.game_logic:
-            self._append_to_output(self.game_logic.get_room_description())
+        room_description = self.game_logic.get_room_description() if self.game_logic else None
+        if room_description: self._append_to_output(room_description)
 
         # Check achievements for completing the *previous* level
         if self.achievements_system and hasattr(self.achievements_system, 'check_level_completion_achievements'):
@@ -1691,9 +1751,9 @@ class GameScreen(BaseScreen):
                 self.achievements_system.check_level_completion_achievements(self.game_logic, previous_level_id)
         
         # Display new room description (might be redundant if already in message from GameLogic)
-        if self.game_logic and self.game_logic.player:  # Ensure game_logic is still valid
-            if not self.output_label.text.strip().endswith(self.game_logic.get_room_description(self.game_logic.player['location']).strip()):
-                self._append_to_output(self.game_logic.get_room_description())
+        if room_description and self.game_logic.player:  # Ensure game_logic is still valid
+            if not self.output_label.text.strip().endswith(room_description.strip()):
+                self._append_to_output(room_description)
         
         self.update_all_ui_elements()
         self.clear_and_display_general_actions()
@@ -1860,6 +1920,7 @@ class GameScreen(BaseScreen):
         # Clear game-specific app state
         app.selected_character_class = None
         app.current_disaster_details = None
+        app.session_seed = None
         app.start_new_session_flag = False  # Reset for next new game
 
         # Reset GameScreen state for potential new game later
@@ -1892,10 +1953,7 @@ class GameScreen(BaseScreen):
                 item_box = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(40), spacing=dp(5))
                 
                 # Determine item color
-                item_master_data = self.game_logic._get_item_data(item_name)
-                item_color_name = 'item'  # Default
-                if item_master_data and item_master_data.get('is_evidence'): item_color_name = 'evidence'
-                elif item_master_data and item_master_data.get('is_key'): item_color_name = 'special'
+                item_color_name = self.game_logic.get_inventory_display_category(item_name)
                 
                 item_label = Label(
                     text=color_text(item_name.capitalize(), item_color_name), 
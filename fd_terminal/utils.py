@@ -1,3 +1,8 @@
+import re
+import contextlib
+import contextvars
+from collections.abc import Mapping, MutableMapping
+
 COLOR_RED = "ff0000"
 COLOR_GREEN = "00ff00"
 COLOR_YELLOW = "ffff00"
@@ -9,6 +14,22 @@ COLOR_LIGHT_GREY = "d3d3d3"
 COLOR_BLUE = "3399ff"
 COLOR_PURPLE = "b266ff"
 
+_plain_text = contextvars.ContextVar("plain_text", default=False)
+
+@contextlib.contextmanager
+def plain_text():
+    """
+    Within the block, color_text, bold_text and KeywordColorizer return the bare text instead of
+    Kivy markup, so non-UI callers (batch runs, tools) skip building markup altogether.
+    """
+    token = _plain_text.set(True)
+    try: yield
+    finally: _plain_text.reset(token)
+
+def is_plain_text():
+    """True inside a plain_text() block."""
+    return _plain_text.get()
+
 def color_text(text, text_type):
     """
     Applies Kivy color markup to text based on a predefined category.
@@ -21,9 +42,10 @@ def color_text(text, text_type):
                          'error', 'warning', 'special', 'turn', 'default'.
 
     Returns:
-        str: The text string with Kivy color markup, or the original text
-             if the text_type is unknown (defaults to white).
+        str: The text string with Kivy color markup (white if the text_type is unknown),
+             or the bare text inside a plain_text() block.
     """
+    if _plain_text.get(): return text
     color_map = {
         'room': COLOR_YELLOW,       # Room names
         'exit': COLOR_CYAN,         # Exit directions
@@ -44,4 +66,169 @@ def color_text(text, text_type):
     color = color_map.get(text_type, COLOR_WHITE)  # Default to white if text_type is not found
     return f"[color={color}]{text}[/color]"
 
+def bold_text(text):
+    """Kivy bold markup around text, or the bare text inside a plain_text() block."""
+    return text if _plain_text.get() else f"[b]{text}[/b]"
+
+
+class KeywordColorizer:
+    """
+    Colors every occurrence of a set of keywords (as written, or capitalized) in one pass.
+    The keywords are compiled into a single alternation regex, longest first, so a keyword
+    inside a longer one ('fire' in 'fireplace') is never colored again inside the inserted markup.
+    Results are memoized per input text, which suits static room and hazard descriptions.
+    """
+
+    def __init__(self, keywords_to_color, max_cached=512):
+        self.markup = {}
+        for keyword, text_type in keywords_to_color.items():
+            for form in (keyword, keyword.capitalize()): self.markup.setdefault(form, color_text(form, text_type))
+        self.pattern = re.compile("|".join(re.escape(form) for form in sorted(self.markup, key=len, reverse=True))) if self.markup else None
+        self.max_cached = max_cached
+        self._cache = {}
+
+    def colorize(self, text):
+        if not self.pattern or not text or _plain_text.get(): return text
+        colored = self._cache.get(text)
+        if colored is None:
+            colored = self.pattern.sub(lambda match: self.markup[match.group(0)], text)
+            if len(self._cache) >= self.max_cached: self._cache.clear()
+            self._cache[text] = colored
+        return colored
+
+
+# --- Read-only shared definitions ---
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is a shared read-only definition; copy it (or use ItemState) before modifying.")
+
+class FrozenDict(dict):
+    """
+    A dict that refuses mutation. Still passes isinstance(x, dict) checks and
+    serializes like a dict, so static game_data content can be shared instead of copied.
+    copy.copy() returns the same object; copy.deepcopy() returns a writable plain copy.
+    """
+    __slots__ = ()
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self): return self
+    def __deepcopy__(self, memo): return thaw(self)
+    def __reduce__(self): return (FrozenDict, (dict(self),))
+
+class FrozenList(list):
+    """A list that refuses mutation; the list counterpart of FrozenDict."""
+    __slots__ = ()
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self): return self
+    def __deepcopy__(self, memo): return thaw(self)
+    def __reduce__(self): return (FrozenList, (list(self),))
+
+def freeze(obj):
+    """Returns a deep read-only view of obj (FrozenDict / FrozenList / frozenset). Nothing is cached."""
+    if isinstance(obj, (FrozenDict, FrozenList, frozenset)): return obj
+    if isinstance(obj, dict): return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list): return FrozenList(freeze(v) for v in obj)
+    if isinstance(obj, tuple): return tuple(freeze(v) for v in obj)
+    if isinstance(obj, set): return frozenset(obj)
+    return obj
+
+# id(definition) -> (definition, frozen). The definition is kept alive so its id cannot be reused,
+# which is only acceptable for static game_data content; transient state goes through freeze().
+_frozen_definitions = {}
+
+def freeze_definition(definition):
+    """
+    freeze() for static game_data definitions (items, hazards, rooms), memoized per source
+    object, so every level init and hazard instance shares one frozen instance.
+    """
+    cached = _frozen_definitions.get(id(definition))
+    if cached is not None and cached[0] is definition: return cached[1]
+    frozen = freeze(definition)
+    if frozen is not definition: _frozen_definitions[id(definition)] = (definition, frozen)
+    return frozen
+
+def thaw(obj):
+    """Returns a writable deep copy (plain dict/list/set) of a frozen or mutable structure."""
+    if isinstance(obj, Mapping): return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, list): return [thaw(v) for v in obj]
+    if isinstance(obj, tuple): return tuple(thaw(v) for v in obj)
+    if isinstance(obj, (set, frozenset)): return set(obj)
+    return obj
+
+class CopyOnWriteState(MutableMapping):
+    """
+    Copy-on-write mapping over a shared frozen master definition. Reads fall through to
+    the master; writes and deletions only touch a small per-instance overlay.
+    """
+    __slots__ = ("base", "overlay", "removed")
+
+    def __init__(self, base=None, overlay=None):
+        self.base = freeze(base) if base is not None else FrozenDict()
+        self.overlay = dict(overlay) if overlay else {}
+        self.removed = set()
+
+    def __getitem__(self, key):
+        if key in self.overlay: return self.overlay[key]
+        if key in self.removed: raise KeyError(key)
+        return self.base[key]
+
+    def __setitem__(self, key, value):
+        self.overlay[key] = value; self.removed.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self: raise KeyError(key)
+        self.overlay.pop(key, None)
+        if key in self.base: self.removed.add(key)
+
+    def __contains__(self, key):
+        return key in self.overlay or (key in self.base and key not in self.removed)
+
+    def __iter__(self):
+        for key in self.base:
+            if key not in self.removed or key in self.overlay: yield key
+        for key in self.overlay:
+            if key not in self.base: yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        if key in self.overlay: return self.overlay[key]
+        if key in self.removed: return default
+        return self.base.get(key, default)
+
+    def mutable(self, key):
+        """
+        Returns a writable version of a nested field (e.g. a room's 'furniture' list),
+        copying it from the master into the overlay on first use.
+        """
+        value = self[key]
+        if isinstance(value, (FrozenDict, FrozenList)):
+            value = thaw(value); self[key] = value
+        return value
+
+    def copy(self):
+        clone = type(self)(self.base, self.overlay); clone.removed = set(self.removed)
+        return clone
+
+    def __copy__(self): return self.copy()
+    def __deepcopy__(self, memo): return thaw(self)
+    def __repr__(self): return f"{type(self).__name__}({dict(self)!r})"
+
+class ItemState(CopyOnWriteState):
+    """Per-level world state of an item: location, container, is_hidden, ... over its master definition."""
+    __slots__ = ()
+
+class RoomState(CopyOnWriteState):
+    """
+    Per-level instance of a room. Descriptions, exits and objects stay shared with
+    game_data.rooms; only flags changed during play (locked, ...) live in the overlay.
+    Nested fields must be written through mutable(), e.g.
+    room.mutable("furniture")[idx]["locked"] = False.
+    """
+    __slots__ = ()
+
 # Re-saved to ensure proper encoding and remove hidden null bytes.